@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of the bias/salience pipeline on synthetic models
+
+Generates Word2Vec-like KeyedVectors models with a controlled vocabulary size, dimension and frequency
+distribution (no corpus needs to be downloaded), times every stage of the pipeline separately and saves
+throughput and peak memory per stage as JSON, so runs can be compared across commits. The cold start
+(time to import the analysis module in a fresh interpreter) is checked against meta.COLD_START_TARGET:
+
+    python benchmark_meta_analysis.py --sizes 10000 50000 200000 --dims 150 --output bench_output.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+from gensim.models.keyedvectors import KeyedVectors, Vocab
+
+import r_leaves_word_embeddings_meta_analysis_notebook as meta
+
+_SYLLABLES = ['ba', 'co', 'di', 'fe', 'ga', 'hi', 'jo', 'ku', 'la', 'me', 'ni', 'po', 'qua', 're', 'si', 'tu',
+              'vo', 'wa', 'xe', 'yo', 'ze', 'str', 'an', 'el', 'on']
+# English-like endings, so the POS tagger sees a realistic mix of nouns, verbs, adjectives and adverbs.
+# Together with _SYLLABLES they form a uniquely decodable code: a word can only be spelled by one sequence of them.
+_SUFFIXES = ['', 's', 'ing', 'ed', 'ly', 'ness', 'ful', 'er', 'est', 'ous', 'ive']
+
+def _synthetic_word(i):
+    '''
+    Word number i of a synthetic vocabulary: i is written in mixed radix, its last digit picking one of _SUFFIXES
+    and the others (in bijective base len(_SYLLABLES)) a non-empty sequence of _SYLLABLES, so different numbers
+    always give different words
+    '''
+    [n, suffix] = divmod(i, len(_SUFFIXES))
+    stem = []
+    n += 1
+    while n > 0:
+        [n, syllable] = divmod(n-1, len(_SYLLABLES))
+        stem.append(_SYLLABLES[syllable])
+    return ''.join(reversed(stem)) + _SUFFIXES[suffix]
+
+def make_synthetic_model(vocab_size, dim, zipf=1.1, maxcount=1000000, mincount=5, seed=0):
+    '''
+    Builds a synthetic KeyedVectors model.
+
+    vocab_size int : number of words
+    dim int : dimension of the embedding vectors
+    zipf float : exponent of the Zipf distribution of the word counts (count of rank r ~ maxcount / (r+1)^zipf)
+    maxcount int : count of the most frequent word
+    mincount int : minimum count of a word (as min_count when training a Word2Vec model)
+    seed int : random seed, the same arguments always build the same model
+    '''
+    rs = np.random.RandomState(seed)
+    # Word numbers are shuffled, so word length and suffix do not follow the frequency rank
+    words = [_synthetic_word(i) for i in rs.permutation(vocab_size).tolist()]
+    counts = np.maximum(mincount, maxcount / np.arange(1, vocab_size+1)**zipf).astype(np.int64)
+
+    model = KeyedVectors(dim)
+    model.vectors = rs.randn(vocab_size, dim).astype(np.float32)
+    model.index2word = words
+    model.vocab = {w: Vocab(index=i, count=int(counts[i])) for i, w in enumerate(words)}
+    return model
+
+def _get_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+def measure_cold_start(repeat=5):
+    '''
+    Best time (seconds) to start a fresh interpreter and import the analysis module, as batch workers do
+    '''
+    cwd = os.path.dirname(os.path.abspath(meta.__file__))
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, '-c', 'import {}'.format(meta.__name__)], cwd=cwd)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def _measure(stage, fn, nwords, repeat):
+    '''
+    Times fn (best of repeat runs), then runs it once more under tracemalloc to get its peak memory
+    '''
+    times = []
+    for i in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    seconds = min(times)
+    return {'stage': stage, 'seconds': seconds, 'words': nwords, 'words_per_sec': nwords/seconds if seconds > 0 else None,
+            'peak_memory_bytes': peak}
+
+def benchmark_model(model, targetsize=200, stdevs=4, depth=3, repeat=3, seed=0):
+    '''
+    Times the stages of the pipeline on model, with two random target sets of targetsize words
+
+    returns
+    list of {'stage', 'seconds', 'words', 'words_per_sec', 'peak_memory_bytes'}
+    '''
+    rs = np.random.RandomState(seed)
+    words = model.wv.index2word
+    nwords = len(words)
+    [targetset1, targetset2] = [[str(w) for w in rs.choice(words, targetsize, replace=False)] for i in range(2)]
+
+    results = []
+    results.append(_measure('_get_model_min_max_rank', lambda: meta._get_model_min_max_rank(model), nwords, repeat))
+    results.append(_measure('_calculate_centroid', lambda: meta._calculate_centroid(model, targetset1), targetsize, repeat))
+    results.append(_measure('pos_tagging', lambda: meta._pos_tag_words(words), nwords, 1))
+    results.append(_measure('sentiment', lambda: meta._get_sentiments(words), nwords, 1))
+    # The first call also builds the word attribute index, later ones read it from the cache
+    results.append(_measure('calculate_biased_words', lambda: meta.calculate_biased_words(model, targetset1, targetset2, stdevs),
+                            nwords, repeat))
+    analysis = meta.MetaAnalysis(model, targetset1, targetset2, stdevs, depth=depth)
+    results.append(_measure('MetaAnalysis depth={}'.format(depth), lambda: list(analysis), nwords*depth, repeat))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks of the bias/salience pipeline on synthetic models')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000, 200000], help='vocabulary sizes')
+    parser.add_argument('--dims', type=int, nargs='+', default=[150], help='embedding dimensions')
+    parser.add_argument('--zipf', type=float, default=1.1, help='Zipf exponent of the word counts')
+    parser.add_argument('--targetsize', type=int, default=200, help='words in each target set')
+    parser.add_argument('--depth', type=int, default=3, help='cycles of the MetaAnalysis stage')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per stage, the best time is kept')
+    parser.add_argument('--output', default='bench_output.json', help='JSON file for the results')
+    args = parser.parse_args()
+
+    report = {'commit': _get_commit(), 'date': datetime.now().isoformat(), 'python': platform.python_version(),
+              'numpy': np.__version__, 'args': vars(args), 'results': []}
+    coldstart = measure_cold_start()
+    report['cold_start'] = {'seconds': coldstart, 'target': meta.COLD_START_TARGET, 'ok': coldstart <= meta.COLD_START_TARGET}
+    print('cold start: {:.3f} s (target {} s) {}'.format(coldstart, meta.COLD_START_TARGET,
+                                                         'OK' if report['cold_start']['ok'] else 'TOO SLOW'))
+    for dim in args.dims:
+        for size in args.sizes:
+            model = make_synthetic_model(size, dim, zipf=args.zipf)
+            for result in benchmark_model(model, targetsize=args.targetsize, depth=args.depth, repeat=args.repeat):
+                result.update({'vocab_size': size, 'dim': dim})
+                report['results'].append(result)
+                print('{:>8} words, d={:<4} {:<40} {:10.4f} s {:>14} words/s {:>10.1f} MB'.format(
+                    size, dim, result['stage'], result['seconds'],
+                    '{:.0f}'.format(result['words_per_sec']) if result['words_per_sec'] else '-',
+                    result['peak_memory_bytes']/2**20))
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print('-> results saved in {}'.format(args.output))
+
+if __name__ == '__main__':
+    main()
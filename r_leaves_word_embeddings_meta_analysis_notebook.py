@@ -7,27 +7,57 @@ Original file is located at
     https://colab.research.google.com/drive/14Lq9MYgIImR1SejGsnvjr38ZsIYjBNQi
 """
 
-from gensim.models import Word2Vec
-from gensim.test.utils import datapath, get_tmpfile
-from gensim.models import KeyedVectors
-from gensim.scripts.glove2word2vec import glove2word2vec
-from operator import itemgetter
-from scipy import spatial
-import nltk
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-nltk.download('averaged_perceptron_tagger')
-nltk.download('vader_lexicon')
-import inflect
+# Heavy dependencies (gensim, nltk, inflect, sklearn) are imported on first use, inside the functions that
+# need them, so importing this module (e.g. in batch worker processes) stays fast. See COLD_START_TARGET.
 import time
 import numpy as np
-import statistics
 import json
-import itertools
+import weakref
+import functools
+import collections
+import contextlib
+import logging
+import hashlib
+import glob
+import os
+import sys
+import tempfile
+import multiprocessing
+import concurrent.futures
+
+# Target time (seconds) to import this module in a fresh interpreter, checked by benchmark_meta_analysis.py
+COLD_START_TARGET = 0.5
+
+# NLTK resources used by the analysis, and where nltk.data.find looks for them. NLTK >= 3.9 loads the English
+# POS tagger from the json files of averaged_perceptron_tagger_eng, older versions from the averaged_perceptron_tagger pickle
+_NLTK_RESOURCES = {
+    'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng/',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger/averaged_perceptron_tagger.pickle',
+    'vader_lexicon': 'sentiment/vader_lexicon.zip',
+}
+
+def _get_tagger_resource():
+    '''
+    Name of the NLTK resource loaded by nltk.pos_tag with the installed NLTK version
+    '''
+    from nltk.tag.perceptron import PerceptronTagger
+    if hasattr(PerceptronTagger, 'load_from_json'):
+        return 'averaged_perceptron_tagger_eng'
+    return 'averaged_perceptron_tagger'
 
-from sklearn.cluster import KMeans
-from sklearn.metrics import silhouette_score
-from datetime import datetime
-import statistics
+@functools.lru_cache(maxsize=None)
+def _ensure_nltk_resource(name):
+    '''
+    Makes sure the NLTK resource is available locally, downloading it only if it is missing
+    (so runs without network work as long as the resources were downloaded once)
+    '''
+    import nltk
+    try:
+        nltk.data.find(_NLTK_RESOURCES[name])
+    except LookupError:
+        if not nltk.download(name, quiet=True):
+            raise LookupError("NLTK resource '{}' is not installed and could not be downloaded. "
+                              "Run nltk.download('{}') with network access.".format(name, name))
 
 def _calculate_centroid(model, wordlist):
     '''
@@ -39,14 +69,36 @@ def _calculate_centroid(model, wordlist):
     return centr/len(wordlist)
 
 def _keep_only_model_words(model, words):
-    aux = [ word for word in words if word in model.wv.vocab.keys()]
+    vocab = model.wv.vocab
+    aux = [ word for word in words if word in vocab]
     return aux
 
-def _get_word_freq(model, word):
-    if word in model.wv.vocab:
-        wm = model.wv.vocab[word]
-        return [word, wm.count, wm.index]
-    return None
+def _get_word_ids(model, words):
+    '''
+    Indexes in the model embedding matrix (model.wv.vocab[w].index) of the words that exist in the model,
+    in the same order as words
+    '''
+    vocab = model.wv.vocab
+    return np.array([vocab[w].index for w in words if w in vocab], dtype=np.int64)
+
+def _unique(words):
+    '''
+    words without duplicates, keeping the order of their first appearance
+    '''
+    return list(dict.fromkeys(words))
+
+_inflect_engine = None
+
+@functools.lru_cache(maxsize=1<<16)
+def _plural(word):
+    '''
+    Plural of word, memoized across calls and cycles (the target sets of consecutive cycles overlap a lot)
+    '''
+    global _inflect_engine
+    if _inflect_engine is None:
+        import inflect
+        _inflect_engine = inflect.engine()
+    return _inflect_engine.plural(word)
 
 def _get_model_min_max_rank(model):
     minF = 999999
@@ -60,48 +112,571 @@ def _get_model_min_max_rank(model):
             maxF = rank
     return [minF, maxF]
 
-sid = SentimentIntensityAnalyzer()
+_sid = None
 def _get_sentiment(word):
-    return sid.polarity_scores(word)['compound']
+    global _sid
+    if _sid is None:
+        _ensure_nltk_resource('vader_lexicon')
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+        _sid = SentimentIntensityAnalyzer()
+    return _sid.polarity_scores(word)['compound']
+
+class _NullStage(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class _NullInstrumentation(object):
+    '''
+    Instrumentation that records nothing, used when no instrumentation is given so that it costs (almost) nothing
+    '''
+    _stage = _NullStage()
+
+    @property
+    def labels(self):
+        return {}
+
+    def stage(self, name):
+        return self._stage
+
+    def count(self, name, n=1):
+        pass
+
+    def progress(self, stage, done, total):
+        pass
+
+    def chunk_size(self, size):
+        return size
+
+_NO_INSTRUMENTATION = _NullInstrumentation()
+
+class Instrumentation(object):
+    '''
+    Per stage timers and counters of calculate_biased_words and MetaAnalysis, to find where the time of a run goes.
+
+    Stages timed: pos_tagging and sentiment (when the word attribute index is built), exclusion, centroids, bias,
+    salience, records and cycle. Counters: words_considered, pos_rejected, biased1, biased2, selected1 and selected2.
+
+    sink callable : called with one dict per event, like {'event': 'stage', 'stage': 'bias', 'seconds': 0.2, 'cycle': 1}
+                    or {'event': 'count', 'counter': 'biased1', 'n': 2311, 'cycle': 1}, e.g. log_metrics or
+                    lambda event: writer.write_line(**event) with a BiasedWordsWriter
+    progress callable : called as progress(stage, done, total) every progressEvery words of the long stages
+                        (pos_tagging, sentiment and bias)
+    progressEvery int : number of words between two progress calls (the long stages process their words in
+                        chunks of at most this size when there is a progress callable, so small values slow them down)
+    labels dict : values added to every event (MetaAnalysis sets 'cycle')
+
+    Totals are kept in timers and counters (see summary()) whether there is a sink or not.
+    '''
+    def __init__(self, sink=None, progress=None, progressEvery=10000, labels=None):
+        self.sink = sink
+        self.progressCallback = progress
+        self.progressEvery = progressEvery
+        self.labels = dict(labels or {})
+        self.timers = collections.defaultdict(float)
+        self.counters = collections.defaultdict(int)
+        self._lastStage = None
+        self._lastProgress = 0
+
+    def _emit(self, event):
+        if self.sink is not None:
+            event.update(self.labels)
+            self.sink(event)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            seconds = time.perf_counter() - start
+            self.timers[name] += seconds
+            self._emit({'event': 'stage', 'stage': name, 'seconds': seconds})
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+        self._emit({'event': 'count', 'counter': name, 'n': n})
+
+    def progress(self, stage, done, total):
+        '''
+        Reports that done of total words of stage are processed. The loops call it once per chunk (see chunk_size),
+        and the progress callback is only called when a multiple of progressEvery (or the total) is reached.
+        '''
+        if self.progressCallback is None:
+            return
+        last = self._lastProgress if self._lastStage == stage else 0
+        if done == total or done // self.progressEvery > last // self.progressEvery:
+            self.progressCallback(stage, done, total)
+        self._lastStage = stage
+        self._lastProgress = 0 if done == total else done
+
+    def chunk_size(self, size):
+        '''
+        Number of words the long loops process between two progress calls, instead of their default chunk size:
+        chunks are made no bigger than progressEvery, so the progress callback fires every progressEvery words
+        '''
+        if self.progressCallback is None:
+            return size
+        return max(1, min(size, self.progressEvery))
+
+    def summary(self):
+        return {'timers': dict(self.timers), 'counters': dict(self.counters)}
+
+def log_metrics(event):
+    '''
+    Instrumentation sink writing every event as a JSON structured log line (logger of this module, INFO level)
+    '''
+    logging.getLogger(__name__).info(json.dumps(event))
+
+# Per word attributes of a model vocabulary, one row per word in model.wv.index2word order (row i is the word with index i)
+_ATTRIBUTES_DTYPE = np.dtype([('pos', 'S6'), ('sent', 'f8'), ('count', 'i8'), ('rank', 'i8')])
+# Number of words tagged per nltk.pos_tag_sents call when building the attribute index
+_POS_CHUNK_SIZE = 10000
+_attributes_cache = weakref.WeakKeyDictionary()
+
+def _get_model_fingerprint(model):
+    '''
+    Fingerprint of the model vocabulary (words, counts and ranks). Word attributes only depend on these,
+    so the fingerprint changes whenever a cached attribute index would become stale.
+    '''
+    h = hashlib.sha1()
+    for w in model.wv.index2word:
+        wm = model.wv.vocab[w]
+        h.update('{}\t{}\t{}\n'.format(w, wm.count, wm.index).encode('utf-8'))
+    return h.hexdigest()[:16]
+
+def _pos_tag_words(words, instr=_NO_INSTRUMENTATION):
+    '''
+    POS tag of every word, as nltk.pos_tag([w])[0][1] would return it.
+
+    Words are tagged in chunks with nltk.pos_tag_sents, each word as its own one-token sentence, so the tags
+    are the same as tagging them one by one while the tagger is only loaded once per chunk instead of once per word.
+    '''
+    import nltk
+    _ensure_nltk_resource(_get_tagger_resource())
+    tags = []
+    chunk = instr.chunk_size(_POS_CHUNK_SIZE)
+    with instr.stage('pos_tagging'):
+        for start in range(0, len(words), chunk):
+            tagged = nltk.pos_tag_sents([[w] for w in words[start:start+chunk]])
+            tags.extend(t[0][1] for t in tagged)
+            instr.progress('pos_tagging', len(tags), len(words))
+    return tags
+
+def _get_sentiments(words, instr=_NO_INSTRUMENTATION):
+    sents = []
+    chunk = instr.chunk_size(_POS_CHUNK_SIZE)
+    with instr.stage('sentiment'):
+        for start in range(0, len(words), chunk):
+            sents.extend(_get_sentiment(w) for w in words[start:start+chunk])
+            instr.progress('sentiment', len(sents), len(words))
+    return sents
+
+def _calculate_word_attributes(model, instr=_NO_INSTRUMENTATION, ids=None):
+    '''
+    Computes POS tag, compound sentiment, count and rank for every word of the model vocabulary.
+
+    ids np.array<int> : if given, POS tag and sentiment are only computed for these rows (the other rows are left
+                        empty), which is much faster than the whole vocabulary when only a few words are analysed
+
+    returns
+    np.array with dtype _ATTRIBUTES_DTYPE, where row i holds the attributes of model.wv.index2word[i]
+    '''
+    words = model.wv.index2word
+    attrs = np.zeros(len(words), dtype=_ATTRIBUTES_DTYPE)
+    if ids is None:
+        ids = np.arange(len(words))
+    else:
+        ids = np.unique(ids)
+    tagged = [words[i] for i in ids.tolist()]
+    attrs['pos'][ids] = [p.encode('utf-8') for p in _pos_tag_words(tagged, instr)]
+    attrs['sent'][ids] = _get_sentiments(tagged, instr)
+    attrs['count'] = [model.wv.vocab[w].count for w in words]
+    attrs['rank'] = [model.wv.vocab[w].index for w in words]
+    return attrs
+
+def load_word_attributes(model, modelpath=None, instr=_NO_INSTRUMENTATION):
+    '''
+    Returns the word attribute index of the model (see _calculate_word_attributes), computing it only once.
+
+    If modelpath is given, the index is persisted next to the model file as <modelpath>.attrs.<fingerprint>.npy
+    and memory mapped on later loads. The fingerprint of the model vocabulary is part of the file name, so a
+    retrained model never picks up a stale index (stale sidecars are removed).
+
+    modelpath str : path of the .model file the model was loaded from
+    instr Instrumentation : records the pos_tagging and sentiment stages if the index has to be computed
+    '''
+    return _load_sidecar(model, modelpath, 'attrs', _get_model_fingerprint,
+                         lambda model: _calculate_word_attributes(model, instr), _attributes_cache)
+
+def _load_sidecar(model, modelpath, kind, fingerprint, calculate, cache):
+    '''
+    Returns calculate(model), cached per model in cache and, if modelpath is given, persisted next to the model
+    file as <modelpath>.<kind>.<fingerprint(model)>.npy and memory mapped (stale <kind> sidecars are removed)
+    '''
+    value = cache.get(model.wv)
+    if value is not None:
+        return value
+    if modelpath is None:
+        value = calculate(model)
+    else:
+        sidecar = '{}.{}.{}.npy'.format(modelpath, kind, fingerprint(model))
+        if not os.path.exists(sidecar):
+            for stale in glob.glob('{}.{}.*.npy'.format(glob.escape(modelpath), kind)):
+                os.remove(stale)
+            value = calculate(model)
+            # Written to a temporary file first, so an interrupted run never leaves a truncated sidecar behind
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(sidecar) or '.', prefix=os.path.basename(sidecar), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, value)
+                os.replace(tmp, sidecar)
+            except BaseException:
+                os.remove(tmp)
+                raise
+        value = np.load(sidecar, mmap_mode='r')
+    cache[model.wv] = value
+    return value
 
 '''
 Normalises a value in the positive space
 '''    
 def _normalise(val, minF, maxF):
     #print(val, minF, maxF)
-    if(maxF<0 or minF<0 or val<0):
+    # val can also be a np.array of values
+    if(maxF<0 or minF<0 or np.min(val)<0):
         raise Exception('All values should be in the positive space. minf: {}, max: {}, freq: {}'.format(minF, maxF, val))
     if(maxF<= minF):
-        raise Exception('Maximum frequency should be bigger than min frequency. minf: {}, max: {}, freq: {}'.format(minF, maxF, freq))
-    val -= minF
+        raise Exception('Maximum frequency should be bigger than min frequency. minf: {}, max: {}, freq: {}'.format(minF, maxF, val))
+    val = val - minF
     val = val/(maxF-minF)
     return val
 
-def _get_cosine_distance(wv1, wv2):
-    return spatial.distance.cosine(wv1, wv2)
+# Number of embedding rows processed per matrix product, so the float64 working copy (about 1 MB at d=150)
+# stays in the CPU cache
+_CHUNK_SIZE = 1024
+# Fraction of the vocabulary above which the bias differences are computed for the whole embedding matrix, read
+# in order, instead of gathering the rows of the words one chunk at a time
+_STREAM_FRACTION = 0.65
+_norms_cache = weakref.WeakKeyDictionary()
 
-def _get_min_max(dict_value):
-    l = list(dict_value.values())
-    return [ min(l), max(l)]
+def _get_vector_norms(model):
+    '''
+    L2 norm of every row of the model embedding matrix (float64), computed once per model and cached
+    '''
+    norms = _norms_cache.get(model.wv)
+    if norms is None:
+        vectors = model.wv.vectors
+        norms = np.empty(len(vectors))
+        for start in range(0, len(vectors), _CHUNK_SIZE):
+            chunk = np.asarray(vectors[start:start+_CHUNK_SIZE], dtype=np.float64)
+            norms[start:start+_CHUNK_SIZE] = np.sqrt(np.einsum('ij,ij->i', chunk, chunk))
+        _norms_cache[model.wv] = norms
+    return norms
+
+def _calculate_bias_differences(model, ids, centroid1, centroid2, instr=_NO_INSTRUMENTATION):
+    '''
+    Vectorised cosine distance between centroid2 and wv minus cosine distance between centroid1 and wv
+    (as given by scipy.spatial.distance.cosine) for every row of the model embedding matrix referenced in ids.
+
+    Cosine distance is 1 - cosine similarity, so the difference is cos(centroid1, wv) - cos(centroid2, wv).
+    Both similarities are obtained with one product of the embedding rows against the two normalised
+    centroids, and divided by the cached row norms.
 
-def _find_stdev_threshold_sal(dwords, stdevs):
+    When ids covers most of the vocabulary (see _STREAM_FRACTION), the whole matrix is streamed in contiguous
+    chunks and the rows of ids are picked from the result, which is faster than gathering them (progress is
+    then reported in rows of the matrix instead of words of ids).
+
+    ids np.array<int> : indexes of the words in the model embedding matrix (model.wv.vocab[w].index)
+
+    returns
+    np.array<float64> with the bias difference of every word in ids
     '''
-    dword is an object like {'word':w, 'bias':bias, 'biasW':biasW, 'freq':freq, 'freqW':freqW, 'sal':val, 'wv':wv, 'sent':sent }
+    vectors = model.wv.vectors
+    norms = _get_vector_norms(model)
+    centroids = np.stack([centroid1/np.linalg.norm(centroid1), centroid2/np.linalg.norm(centroid2)], axis=1)
+    chunk = instr.chunk_size(_CHUNK_SIZE)
+    if len(ids) < _STREAM_FRACTION*len(vectors):
+        diffs = np.empty(len(ids))
+        for start in range(0, len(ids), chunk):
+            rows = ids[start:start+chunk]
+            sims = np.asarray(vectors[rows], dtype=np.float64).dot(centroids)
+            diffs[start:start+chunk] = (sims[:, 0] - sims[:, 1]) / norms[rows]
+            instr.progress('bias', start+len(rows), len(ids))
+        return diffs
+    diffs = np.empty(len(vectors))
+    for start in range(0, len(vectors), chunk):
+        sims = np.asarray(vectors[start:start+chunk], dtype=np.float64).dot(centroids)
+        diffs[start:start+chunk] = sims[:, 0] - sims[:, 1]
+        instr.progress('bias', min(start+chunk, len(vectors)), len(vectors))
+    return diffs[ids] / norms[ids]
+
+def _find_stdev_threshold_sal(allsal, stdevs):
+    '''
+    allsal np.array<float> : salience values of all the candidate biased words
     stdevs : minimum stdevs for which we want to compute the threshold
 
     returns
-    outlier_thr : the threshold correpsonding to stdevs considering salience values from the dwrods object list
+    outlier_thr : the threshold correpsonding to stdevs considering the salience values (sample stdev)
     '''
-    allsal = []
-    for obj in dwords:
-        allsal.append(obj['sal'])
-    stdev = statistics.stdev(allsal)
-    outlier_thr = (stdev*stdevs)+sum(allsal)/len(allsal)
+    stdev = np.std(allsal, ddof=1)
+    outlier_thr = (stdev*stdevs)+np.mean(allsal)
     return outlier_thr
 
+# One record per biased word. Vectors are not copied: id is the row of the word in the model embedding matrix
+_BIASED_WORDS_DTYPE = np.dtype([('id', 'i8'), ('bias', 'f8'), ('biasW', 'f8'), ('freq', 'i8'), ('rank', 'i8'),
+                                ('rankW', 'f8'), ('sal', 'f8'), ('sent', 'f8')])
+
+class WordRecords(object):
+    '''
+    Columnar set of words of a model: records is a structured np.array with one record per word, whose id field is
+    the row of the word in the model embedding matrix. Words and vectors are looked up in the model on demand.
+    '''
+    def __init__(self, model, records):
+        self.model = model
+        self.records = records
+
+    def __len__(self):
+        return len(self.records)
+
+    def words(self):
+        index2word = self.model.wv.index2word
+        return [index2word[i] for i in self.records['id'].tolist()]
+
+    def vectors(self):
+        return self.model.wv.vectors[self.records['id']]
+
+    def to_dict(self):
+        '''
+        returns
+        {word: {'word':w, <record fields but id>, 'wv':wv }}, for BiasedWords
+        {word: {'word':w, 'bias':bias, 'biasW':biasW, 'freq':freq, 'rank':rank, 'rankW':rankW, 'sal':val, 'wv':wv, 'sent':sent }}
+        '''
+        vectors = self.model.wv.vectors
+        result = {}
+        for w, rec in zip(self.words(), self.records.tolist()):
+            obj = dict(zip(self.records.dtype.names, rec))
+            obj['word'] = w
+            obj['wv'] = vectors[obj.pop('id')].tolist()
+            result[w] = obj
+        return result
+
+class BiasedWords(WordRecords):
+    '''
+    Columnar set of biased words, as returned by a MetaAnalysis cycle: records is a np.array with dtype
+    _BIASED_WORDS_DTYPE, and to_dict() gives the per word dict format returned by calculate_biased_words.
+    '''
+
+# One record per clustered word: its cluster label, and its distance to the cluster centroid
+_WORD_CLUSTERS_DTYPE = np.dtype([('id', 'i8'), ('cluster', 'i4'), ('dist', 'f8')])
+
+class WordClusters(WordRecords):
+    '''
+    Clusters of a set of words, as returned by cluster_words: records is a np.array with dtype _WORD_CLUSTERS_DTYPE.
+
+    centroids np.array : k x dim centroids of the clusters (in the unit vector space the words were clustered in)
+    silhouettes dict : {k: sampled silhouette score} of every candidate number of clusters evaluated
+    '''
+    def __init__(self, model, records, centroids, silhouettes):
+        WordRecords.__init__(self, model, records)
+        self.centroids = centroids
+        self.silhouettes = silhouettes
+
+    def clusters(self):
+        '''
+        returns
+        list of k lists with the words of every cluster, closest to the centroid first
+        '''
+        words = self.words()
+        order = np.lexsort((self.records['dist'], self.records['cluster']))
+        result = [[] for c in range(len(self.centroids))]
+        for i in order.tolist():
+            result[self.records['cluster'][i]].append(words[i])
+        return result
+
+class BiasedWordsWriter(object):
+    '''
+    Streaming JSON Lines writer of WordRecords (biased words, clusters): every added result set is written straight
+    to disk, one line per word like {<fields>, 'word':w, 'id':id, 'bias':bias, ...}, so large runs never hold all
+    their results in memory.
+
+    fields are extra values written on every line of a result set, e.g. job=3, cycle=1, set=2
+    '''
+    def __init__(self, path):
+        self.f = open(path, 'w')
+
+    def write(self, biased, **fields):
+        self.write_records(biased.words(), biased.records, **fields)
+
+    def write_records(self, words, records, **fields):
+        for w, rec in zip(words, records.tolist()):
+            line = dict(fields)
+            line['word'] = w
+            line.update(zip(records.dtype.names, rec))
+            self.f.write(json.dumps(line) + '\n')
+        self.f.flush()
+
+    def write_line(self, **fields):
+        self.f.write(json.dumps(fields) + '\n')
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_DEFAULT_ACCEPTED_POS = ['JJ', 'JJS', 'JJR','NN', 'NNS', 'NNP', 'NNPS','VB', 'VBG', 'VBD', 'VBN', 'VBP', 'VBZ' ]
+
+class MetaAnalysis(object):
+    '''
+    Meta analysis of biased words: the biased words found for targetset1 and targetset2 become the target sets
+    of the next cycle, for depth cycles (or until the sets stop changing if converge is True).
+
+    Everything that only depends on the model (word attributes, POS filtered vocabulary, rank weights, plurals of
+    the target words) is computed once and shared by all the cycles, so each new layer only recomputes the
+    centroids and the bias/salience values. Iterating over the analysis yields [biased1, biased2] (BiasedWords)
+    as soon as each cycle finishes, so long runs can be watched and stopped early.
+
+    targetset1 <list of strings> : seed target set 1
+    targetset2 <list of strings> : seed target set 2
+    stdevs int : Minium threhsold for stdev to select biased words
+    depth int : maximum number of cycles
+    converge bool : stop before depth if a cycle returns the same target sets it was given
+    acceptedPOS <list<str>> : accepted list of POS to consider for the analysis, as defined in NLTK POS tagging lib.
+                              If None, no POS filtering is applied and all words in the vocab are considered
+    words list<str> : list of words we want to consider. If None, all words in the vocab (minus target words) are considered.
+                      If given (and no modelpath), only these words are POS tagged and scored for sentiment
+    modelpath str : path of the .model file the model was loaded from, to persist the word attribute index next to
+                    it, see load_word_attributes
+    instrumentation Instrumentation : per stage timers, counters and progress of the analysis (none by default)
+    '''
+    def __init__(self, model, targetset1, targetset2, stdevs, depth=6, converge=False,
+                 acceptedPOS=_DEFAULT_ACCEPTED_POS, words=None, modelpath=None, instrumentation=None):
+        if(model is None):
+            raise Exception("You need to define a model to estimate biased words.")
+        if(targetset1 is None or targetset2 is None):
+            raise Exception("Target sets are necessary to estimate biased words.")
+        if(stdevs is None):
+            raise Exception("You need to define a minimum threshold for standard deviation to select biased words.")
+        self.model = model
+        self.targetset1 = targetset1
+        self.targetset2 = targetset2
+        self.stdevs = stdevs
+        self.depth = depth
+        self.converge = converge
+        self.excludeTargets = words is None
+        self.instr = instr = instrumentation or _NO_INSTRUMENTATION
+
+        # Candidate words (as ids in the embedding matrix), POS filtered once for all the cycles
+        if(words is None):
+            ids = np.fromiter((wm.index for wm in model.wv.vocab.values()), dtype=np.int64, count=len(model.wv.vocab))
+        else:
+            ids = np.array([model.wv.vocab[w].index for w in words], dtype=np.int64)
+
+        if words is None or modelpath is not None or model.wv in _attributes_cache:
+            self.attrs = load_word_attributes(model, modelpath, instr)
+        else:
+            # Only the candidate words need a POS tag and a sentiment, not the whole vocabulary
+            self.attrs = _calculate_word_attributes(model, instr, ids)
+        [minR, maxR] = _get_model_min_max_rank(model)
+        self.rankW = 1-_normalise(self.attrs['rank'].astype(np.float64), minR, maxR)
+
+        if acceptedPOS is not None:
+            accepted = ids[np.isin(self.attrs['pos'][ids], [p.encode('utf-8') for p in acceptedPOS])]
+            instr.count('pos_rejected', len(ids)-len(accepted))
+            ids = accepted
+        self.ids = ids
+
+    def cycle(self, targetset1, targetset2):
+        '''
+        Runs a single cycle of the analysis for the given target sets.
+
+        returns
+        [biased1, biased2] : BiasedWords towards targetset1 and targetset2
+        '''
+        with self.instr.stage('cycle'):
+            return self._cycle(targetset1, targetset2)
+
+    def _cycle(self, targetset1, targetset2):
+        model = self.model
+        attrs = self.attrs
+        instr = self.instr
+        tset1 = _keep_only_model_words(model, targetset1) # remove target set words that do not exist in the model
+        tset2 = _keep_only_model_words(model, targetset2) # remove target set words that do not exist in the model
+
+        # We remove words in the target sets, and also their plurals from the set of interesting words to process.
+        ids = self.ids
+        if(self.excludeTargets):
+            with instr.stage('exclusion'):
+                toremove = set(targetset1) | set(targetset2)
+                toremove.update([_plural(w) for w in toremove])
+                ids = ids[np.isin(ids, _get_word_ids(model, toremove), invert=True)]
+        instr.count('words_considered', len(ids))
+
+        # Calculate centroids 
+        with instr.stage('centroids'):
+            tset1_centroid = _calculate_centroid(model, tset1)
+            tset2_centroid = _calculate_centroid(model, tset2)
+
+        # Get biases for words: positive differences are biased towards targetset1, the rest towards targetset2
+        with instr.stage('bias'):
+            diffs = _calculate_bias_differences(model, ids, tset1_centroid, tset2_centroid, instr)
+        result = []
+        for tset, side, sign in [(1, diffs>0, 1), (2, diffs<=0, -1)]:
+            sideids = ids[side]
+            instr.count('biased{}'.format(tset), len(sideids))
+            with instr.stage('salience'):
+                bias = sign*diffs[side]
+                # Normalise bias with the min and max bias of the target set, and weight it with the rank
+                [minb, maxb] = [np.min(bias), np.max(bias)]
+                biasW = _normalise(bias, minb, maxb)
+                rankW = self.rankW[sideids]
+                sal = biasW * rankW
+
+                # Calculate the salience threshold, and select the list of biased words (i.e., which words do we discard?)
+                threshold = _find_stdev_threshold_sal(sal, self.stdevs)
+                keep = sal >= threshold
+            with instr.stage('records'):
+                records = np.empty(np.count_nonzero(keep), dtype=_BIASED_WORDS_DTYPE)
+                records['id'] = sideids[keep]
+                records['bias'] = bias[keep]
+                records['biasW'] = biasW[keep]
+                records['freq'] = attrs['count'][records['id']]
+                records['rank'] = attrs['rank'][records['id']]
+                records['rankW'] = rankW[keep]
+                records['sal'] = sal[keep]
+                records['sent'] = attrs['sent'][records['id']]
+            instr.count('selected{}'.format(tset), len(records))
+            result.append(BiasedWords(model, records))
+        return result
+
+    def __iter__(self):
+        targetset1 = self.targetset1
+        targetset2 = self.targetset2
+        try:
+            for layer in range(self.depth):
+                self.instr.labels['cycle'] = layer+1
+                [biased1, biased2] = self.cycle(targetset1, targetset2)
+                yield [biased1, biased2]
+                next1 = biased1.words()
+                next2 = biased2.words()
+                if(self.converge and set(next1)==set(targetset1) and set(next2)==set(targetset2)):
+                    return
+                targetset1 = next1
+                targetset2 = next2
+        finally:
+            # Events recorded after the analysis (e.g. clustering its results) do not belong to its last cycle
+            self.instr.labels.pop('cycle', None)
+
 def calculate_biased_words(model, targetset1, targetset2, stdevs, 
-                         acceptedPOS = ['JJ', 'JJS', 'JJR','NN', 'NNS', 'NNP', 'NNPS','VB', 'VBG', 'VBD', 'VBN', 'VBP', 'VBZ' ], 
-                         words = None, force=False):
+                         acceptedPOS = _DEFAULT_ACCEPTED_POS, 
+                         words = None, force=False, modelpath=None, instrumentation=None):
     '''
     this function calculates the list of biased words towards targetset1 and taregset2 with salience > than the 
     specified times (minstdev) of standard deviation.
@@ -112,165 +687,283 @@ def calculate_biased_words(model, targetset1, targetset2, stdevs,
     acceptedPOS <list<str>> : accepted list of POS to consider for the analysis, as defined in NLTK POS tagging lib. 
                               If None, no POS filtering is applied and all words in the vocab are considered
     words list<str> : list of words we want to consider. If None, all words in the vocab are considered
+    modelpath str : path of the .model file the model was loaded from, to persist the word attribute index next to it
+    instrumentation Instrumentation : per stage timers, counters and progress of the computation (none by default)
+
+    To chain several cycles use MetaAnalysis, which shares the model-wide precomputation between them.
+    '''
+    analysis = MetaAnalysis(model, targetset1, targetset2, stdevs, depth=1, acceptedPOS=acceptedPOS, words=words,
+                            modelpath=modelpath, instrumentation=instrumentation)
+    return [biased.to_dict() for biased in analysis.cycle(targetset1, targetset2)]
+
+def _evaluate_kmeans(vectors, k, sample_size, batch_size, seed):
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.metrics import silhouette_score
+    kmeans = MiniBatchKMeans(n_clusters=k, batch_size=batch_size, random_state=seed).fit(vectors)
+    score = silhouette_score(vectors, kmeans.labels_, sample_size=min(sample_size, len(vectors)), random_state=seed)
+    return [kmeans, score]
+
+def cluster_words(words, ks=range(2, 11), sample_size=2000, batch_size=1024, n_jobs=None, seed=0,
+                  instrumentation=None):
+    '''
+    Clusters a set of words (e.g. the BiasedWords of a MetaAnalysis cycle) into themes, directly on the rows of
+    the model embedding matrix (normalised to unit length, so distances follow the cosine similarity).
+
+    Every candidate k is fitted with mini-batch k-means and scored with the silhouette of a random sample of
+    sample_size words (the full silhouette is quadratic in the number of words), and the k with the best score
+    is kept. Candidates are evaluated in parallel threads, and the BLAS/OpenMP thread pools of the k-means are
+    limited so that all the threads together use at most one thread per CPU.
+
+    words WordRecords : words to cluster
+    ks <list<int>> : candidate numbers of clusters (values outside 2..len(words)-1 are skipped)
+    sample_size int : number of words sampled to compute each silhouette score
+    batch_size int : mini-batch size of the k-means
+    n_jobs int : number of threads evaluating candidates, defaults to one per candidate (up to the number of CPUs),
+                 or to 1 inside the worker processes of run_batch (the pool already keeps every CPU busy)
+    seed int : random seed of the k-means and the silhouette sampling
+    instrumentation Instrumentation : records the clustering stage and the chosen k (counter 'clusters')
+
+    returns
+    WordClusters
     '''
-    if(model is None):
-        raise Exception("You need to define a model to estimate biased words.")
-    if(targetset1 is None or targetset2 is None):
-        raise Exception("Target sets are necessary to estimate biased words.")
-    if(stdevs is None):
-        raise Exception("You need to define a minimum threshold for standard deviation to select biased words.")
-   
-    tset1 = _keep_only_model_words(model, targetset1) # remove target set words that do not exist in the model
-    tset2 = _keep_only_model_words(model, targetset2) # remove target set words that do not exist in the model
-
-    # We remove words in the target sets, and also their plurals from the set of interesting words to process.
-    engine = inflect.engine()
-    toremove = targetset1 + targetset2 + [engine.plural(w) for w in targetset1] + [engine.plural(w) for w in targetset2]
-    if(words is None):
-        words = [w for w in model.wv.vocab.keys() if w not in toremove]
-
-    # Calculate centroids 
-    tset1_centroid = _calculate_centroid(model, tset1)
-    tset2_centroid = _calculate_centroid(model, tset2)
-    [minR, maxR] = _get_model_min_max_rank(model)
-
-    # Get biases for words
-    biasWF = {}
-    biasWM = {}
-    for i, w in enumerate(words):
-        p = nltk.pos_tag([w])[0][1]
-        if acceptedPOS is not None and p not in acceptedPOS:
-            continue
-        wv = model.wv[w]
-        diff = _get_cosine_distance(tset2_centroid, wv) - _get_cosine_distance(tset1_centroid, wv)
-        if(diff>0):
-            biasWF[w] = diff
+    instr = instrumentation or _NO_INSTRUMENTATION
+    model = words.model
+    ids = words.records['id']
+    with instr.stage('clustering'):
+        vectors = np.asarray(model.wv.vectors[ids], dtype=np.float64) / _get_vector_norms(model)[ids, None]
+        ks = [k for k in ks if 2 <= k < len(ids)]
+        if not ks:
+            # Too few words to compare clusterings, they are all one theme
+            fits = {}
+            labels = np.zeros(len(ids), dtype=np.int32)
+            centroids = vectors.mean(axis=0, keepdims=True) if len(ids) else np.zeros((0, vectors.shape[1]))
         else:
-            biasWM[w] = -1*diff
-
-    # Get min and max bias for both target sets, so we can normalise these values later
-    [minbf, maxbf] = _get_min_max(biasWF)
-    [minbm, maxbm] = _get_min_max(biasWM)
-
-    # Iterate through all 'selected' words
-    biased1 = []
-    biased2 = []
-    for i, w in enumerate(words):
-        # Print('..Processing ', w)
-        p = nltk.pos_tag([w])[0][1]
-        if acceptedPOS is not None and p not in acceptedPOS:
-            continue
-        wv = model.wv[w]
-        # Sentiment
-        sent = _get_sentiment(w)
-        # Rank and rank norm
-        freq = _get_word_freq(model, w)[1]
-        rank = _get_word_freq(model, w)[2]
-        rankW = 1-_normalise(rank, minR, maxR) 
-
-        # Normalise bias
-        if(w in biasWF):
-            bias = biasWF[w]
-            biasW = _normalise(bias, minbf, maxbf)
-            val = biasW * rankW
-            biased1.append({'word':w, 'bias':bias, 'biasW':biasW, 'freq':freq, 'rank':rank, 'rankW':rankW, 'sal':val, 'wv':wv.tolist(), 'sent':sent } ) 
-        if(w in biasWM):
-            bias = biasWM[w]
-            biasW = _normalise(bias, minbm, maxbm)
-            val = biasW * rankW
-            biased2.append({'word':w, 'bias':bias, 'biasW':biasW, 'freq':freq, 'rank':rank, 'rankW':rankW, 'sal':val, 'wv':wv.tolist(), 'sent':sent } ) 
-
-    # Calculate the salience threshold for both word sets, and select the list of biased words (i.e., which words do we discard?)
-    stdevs1_thr = _find_stdev_threshold_sal(biased1, stdevs)
-    stdevs2_thr = _find_stdev_threshold_sal(biased2, stdevs)
-    # biased1.sort(key=lambda x: x['sal'], reverse=True)
-    b1_dict = {}
-    for k in biased1:
-        if(k['sal']>=stdevs1_thr):
-            b1_dict[k['word']] = k
-    # biased2.sort(key=lambda x: x['sal'], reverse=True)
-    b2_dict = {}
-    for k in biased2:
-        if(k['sal']>=stdevs2_thr):
-            b2_dict[k['word']] = k
-
-    #transform centroid tol list so they become serializable
-    tset1_centroid = tset1_centroid.tolist() 
-    tset2_centroid = tset2_centroid.tolist()
-    return [b1_dict, b2_dict]
-
-modelpath = "leaves_w4_f10_e100_d150.model"
-model = Word2Vec.load(modelpath)
+            from threadpoolctl import threadpool_limits
+            cpus = os.cpu_count() or 1
+            if n_jobs is None:
+                n_jobs = 1 if multiprocessing.current_process().daemon else min(len(ks), cpus)
+            evaluate = lambda k: _evaluate_kmeans(vectors, k, sample_size, batch_size, seed)
+            with threadpool_limits(limits=max(1, cpus//n_jobs)), concurrent.futures.ThreadPoolExecutor(n_jobs) as executor:
+                fits = dict(zip(ks, executor.map(evaluate, ks)))
+            best = max(ks, key=lambda k: fits[k][1])
+            labels = fits[best][0].labels_.astype(np.int32)
+            centroids = fits[best][0].cluster_centers_
+        records = np.empty(len(ids), dtype=_WORD_CLUSTERS_DTYPE)
+        records['id'] = ids
+        records['cluster'] = labels
+        records['dist'] = np.linalg.norm(vectors - centroids[labels], axis=1)
+    instr.count('clusters', len(centroids))
+    return WordClusters(model, records, centroids, {k: float(fit[1]) for k, fit in fits.items()})
+
+# Model loaded by the current (batch worker) process, by model path (at most one)
+_loaded_models = {}
+
+def _load_model(modelpath):
+    '''
+    Loads a model with its embedding matrix memory mapped (read only), so that batch workers running on the same
+    model share the same pages instead of holding one copy each. The model stays loaded for the next jobs of the
+    process, and is released (with its cached norms and attributes) when a job needs another model.
+    '''
+    from gensim.models import KeyedVectors
+    model = _loaded_models.get(modelpath)
+    if model is None:
+        _loaded_models.clear()
+        model = KeyedVectors.load(modelpath, mmap='r')
+        _loaded_models[modelpath] = model
+    return model
+
+def _run_batch_job(job):
+    '''
+    Runs the meta analysis described by one manifest entry
+    '''
+    [i, job] = job
+    result = {'job': i, 'model': job['model']}
+    try:
+        model = _load_model(job['model'])
+        instr = Instrumentation() if job.get('instrument', False) else None
+        analysis = MetaAnalysis(model, job['targetset1'], job['targetset2'], job['stdevs'],
+                                depth=job.get('depth', 1), converge=job.get('converge', False),
+                                modelpath=job['model'], instrumentation=instr)
+        # Only words and records travel back to the parent process, vectors stay in the model
+        cycles = []
+        clusters = []
+        for cycle in analysis:
+            cycles.append([[biased.words(), biased.records] for biased in cycle])
+            if job.get('cluster', False):
+                clustered = [cluster_words(biased, instrumentation=instr) for biased in cycle]
+                clusters.append([[c.words(), c.records, c.centroids] for c in clustered])
+        # Results are only attached once every cycle succeeded, a failed job only reports its error
+        result['cycles'] = cycles
+        if job.get('cluster', False):
+            result['clusters'] = clusters
+        if instr is not None:
+            result['metrics'] = instr.summary()
+    except Exception as e:
+        result['error'] = repr(e)
+    return result
+
+def _build_batch_sidecars(modelpath):
+    '''
+    Builds the word attribute sidecar of one model of a batch
 
-import time
-starttime = time.time()
-
-
-progress = ['discussion', 'find', 'understanding', 'useful', 'support', 'group', 'approach', 'subreddit', 'perspective', 'benefit', 'therapy', 'positive', 'improve', 'helpful', 'reflect', 'motivate', 'practice', 'sub', 'focused', 'provide', 'information', 'knowledge', 'encourage', 'meditate', 'focusing', 'mindfulness', 'guidance', 'outlook', 'skill', 'guide', 'headspace', 'technique', 'forum', 'compassion', 'practicing', 'tool', 'insight', 'techniques', 'achieve', 'accountability', 'awareness', 'meditating', 'buddhism', 'channel', 'importance', 'identify', 'beneficial', 'engage', 'explore', 'constructive', 'mindful', 'cultivate', 'resources', 'resource', 'acceptance', 'journaling', 'grounded', 'positivity', 'spirituality', 'mediation', 'gratitude', 'refocus', 'community', 'help', 'exercise', 'success', 'create', 'recovery', 'others', 'address', 'methods', 'learn', 'interests', 'journey', 'seek', 'practical', 'strategies', 'reflection', 'meditation', 'develop', 'discipline', 'value', 'growth', 'ideas', 'focus', 'strategy', 'tips', 'behavioral', 'solutions', 'wisdom', 'philosophy', 'introspection', 'structure', 'kindness', 'implement', 'info', 'discuss', 'utilize', 'strengthen', 'dbt', 'meditations', 'reinforce', 'cbt', 'stoicism', 'build', 'experiences', 'form', 'overcome', 'ways', 'suggestions', 'activities', 'groups', 'research', 'insights', 'website', 'lessons', 'psychology', 'mechanisms', 'alternatives', 'literature', 'sources', 'principles', 'behaviors', 'tools', 'perspectives', 'practices', 'habits', 'areas', 'network', 'subreddits', 'challenges', 'options', 'evidence', 'program', 'advice', 'hobbies', 'strength', 'exercises', 'aspects', 'boundaries', 'books', 'concepts', 'studies', 'programs', 'link', 'beliefs', 'foundation', 'concept', 'method', 'apps', 'outlets', 'communities', 'topics', 'links', 'routines', 'data', 'qualities', 'values', 'material', 'recommendations', 'people', 'meetings', 'points', 'things', 'medications', 'stories', 'posts', 'websites', 'site', 'folks', 'projects', 'goals', 'addictions', 'path', 'results', 'vices', 'diet', 'ones', 'threads', 'articles', 'subs', 'skills', 'circumstances', 'examples', 'efforts', 'parts', 'opinions', 'rules', 'supplements', 'factors', 'videos', 'distractions', 'conditions', 'forms', 'guidelines', 'therapists', 'traits', 'affirmations', 'friendships', 'context', 'reasons', 'quotes', 'stuff', 'words', 'benefits', 'steps', 'foods', 'book', 'professionals', 'struggles', 'successes', 'places', 'answers', 'types', 'individuals', 'forums', 'questions', 'substances', 'outcomes', 'remedies', 'accounts', 'treatments', 'stats', 'journeys', 'items', 'possibilities', 'courses', 'services', 'elements', 'teachings']
-exasperation = ['gonna', 'haha', 'coke', 'had', 'yup', 'half', 'yeah', 'bad', 'depressed', 'hell', 'kinda', 'miserable', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'ridiculous', 'fuck', 'drunk', 'awful', 'sucks', 'omg', 'ass', 'pathetic', 'nasty', 'tho', 'ha', 'oh', 'terrible', 'yesterday', 'sad', 'resin', 'dead', 'retarded', 'sack', 'everytime', 'stupid', 'lol', 'wicked', 'crazy', 'gross', 'crappy', 'fiend', 'sick', 'crack', 'grumpy', 'bc', 'cuz', 'nope', 'dope', 'yea', 'weird', 'horrible', 'lame', 'disgusting', 'dumb', 'balls', 'dank', 'hella', 'eh', 'didnt', 'crap', 'freaking', 'legit', 'yep', 'nah', 'dirty', 'fucker', 'pissed', 'junkie', 'garbage', 'hangovers', 'hahaha', 'dang', 'dying', 'bastard', 'burnt', 'cus', 'worthless', 'hahah', 'lmao', 'crackhead', 'af', 'bruh', 'carts', 'didn', 'last', 'anyways', 'mad', 'pussy', 'alright', 'meh', 'hated', 'lazy', 'straight', 'ok', 'moody', 'paranoid', 'tired', 'anxious', 'lethargic', 'meth', 'irritable', 'sorta', 'dry', 'hungry', 'cos', 'nuts', 'embarrassing', 'cranky', 'annoying', 'broke', 'scared', 'nauseated', 'bum', 'loser', 'tbh', 'guilty', 'till', 'boy', 'groggy', 'idiot', 'brutal', 'nauseous', 'hungover', 'foggy', 'bummed', 'wet', 'dizzy', 'terrified', 'rn', 'lmfao', 'fine', 'okay', 'high', 'stoned', 'afterwards', 'upset', 'blazed', 'weak', 'embarrassed', 'bored', 'forgetful', 'stressed', 'awkward', 'boring', 'empty', 'angry', 'nervous', 'restless', 'ashamed', 'baked', 'depressing', 'exhausted', 'frustrated', 'irritated', 'disappointed', 'confused', 'bitter', 'cloudy', 'tempted', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'crying', 'edgy', 'sore', 'agitated', 'skinny', 'unmotivated', 'sluggish', 'hopeless', 'drained', 'sweaty', 'horny', 'bloated', 'odd', 'low', 'hate', 'stuck', 'worse', 'sleepy', 'tempting', 'unhappy', 'unproductive', 'worried', 'overwhelmed', 'frustrating', 'dull', 'jealous', 'suicidal', 'desperate', 'strange', 'rough', 'scary', 'fried', 'antsy', 'trapped', 'apathetic', 'useless', 'relieved', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'thirsty', 'shaky', 'uneasy', 'normal', 'overwhelming', 'stressful', 'numb', 'intense', 'insecure', 'drowsy', 'isolated', 'jittery', 'unpleasant', 'relaxed', 'impatient', 'exhausting', 'defeated', 'disconnected']
-[cycle1, cycle1a] = calculate_biased_words(model, progress, exasperation, 4)
-[cycle2, cycle2a] = calculate_biased_words(model, [w for w in cycle1.keys()], [w for w in cycle1a.keys()], 4)
-[cycle3, cycle3a] = calculate_biased_words(model, [w for w in cycle2.keys()], [w for w in cycle2a.keys()], 4)
-[cycle4, cycle4a] = calculate_biased_words(model, [w for w in cycle3.keys()], [w for w in cycle3a.keys()], 4)
-[cycle5, cycle5a] = calculate_biased_words(model, [w for w in cycle4.keys()], [w for w in cycle4a.keys()], 4)
-[cycle6, cycle6a] = calculate_biased_words(model, [w for w in cycle5.keys()], [w for w in cycle5a.keys()], 4)
-print('-> meta-analysis only took us {} seconds!'.format(time.time()-starttime))
-
-print('My seed words related to progress:')
-print(progress)
-print()
-print('Biased words towards progress')
-print( [w for w in cycle1.keys()] )
-print()
-print('Layer 1 metabiased words towards progress')
-print( [w for w in cycle2.keys()])
-print()
-print('Layer 3 metabiased words towards progress')
-print( [w for w in cycle3.keys()])
-print()
-print('Layer 4 metabiased words towards progress')
-print( [w for w in cycle4.keys()])
-print()
-print('Layer 4 metabiased words towards progress')
-print( [w for w in cycle5.keys()])
-print()
-print('Layer 5 metabiased words towards progress')
-print( [w for w in cycle6.keys()])
-print()
-print()
-print('My seed words related to exasperation:')
-print(exasperation)
-print()
-print('Biased words towards exasperation')
-print( [w for w in cycle1a.keys()] )
-print()
-print('Layer 1 metabiased words towards exasperation')
-print( [w for w in cycle2a.keys()])
-print()
-print('Layer 2 metabiased words towards exasperation')
-print( [w for w in cycle3a.keys()])
-print()
-print('Layer 3 metabiased words towards exasperation')
-print( [w for w in cycle4a.keys()])
-print()
-print('Layer 4 metabiased words towards exasperation')
-print( [w for w in cycle5a.keys()])
-print()
-print('Layer 5 metabiased words towards exasperation')
-print( [w for w in cycle6a.keys()])
-
-progwordbank = ['discussion', 'find', 'understanding', 'useful', 'support', 'group', 'approach', 'subreddit', 'perspective', 'benefit', 'therapy', 'positive', 'improve', 'helpful', 'reflect', 'motivate', 'practice', 'sub', 'focused', 'provide', 'information', 'knowledge', 'encourage', 'meditate', 'focusing', 'mindfulness', 'guidance', 'outlook', 'skill', 'guide', 'headspace', 'technique', 'forum', 'compassion', 'practicing', 'tool', 'insight', 'techniques', 'achieve', 'accountability', 'awareness', 'meditating', 'buddhism', 'channel', 'importance', 'identify', 'beneficial', 'engage', 'explore', 'constructive', 'mindful', 'cultivate', 'resources', 'resource', 'acceptance', 'journaling', 'grounded', 'positivity', 'spirituality', 'mediation', 'gratitude', 'refocus','community', 'help', 'exercise', 'success', 'create', 'recovery', 'others', 'address', 'methods', 'learn', 'interests', 'journey', 'seek', 'practical', 'strategies', 'reflection', 'meditation', 'develop', 'discipline', 'value', 'growth', 'ideas', 'focus', 'strategy', 'tips', 'behavioral', 'solutions', 'wisdom', 'philosophy', 'introspection', 'structure', 'kindness', 'implement', 'info', 'discuss', 'utilize', 'strengthen', 'dbt', 'meditations', 'reinforce', 'cbt', 'stoicism', 'discussion', 'find', 'understanding', 'support', 'build', 'group', 'approach', 'experiences', 'form', 'perspective', 'overcome', 'therapy', 'ways', 'suggestions', 'activities', 'groups', 'practice', 'provide', 'research', 'insights', 'website', 'information', 'knowledge', 'mindfulness', 'guidance', 'skill', 'lessons', 'guide', 'psychology', 'mechanisms', 'technique', 'compassion', 'alternatives', 'literature', 'tool', 'sources', 'principles', 'insight', 'techniques', 'behaviors', 'awareness', 'buddhism', 'channel', 'importance', 'tools', 'perspectives', 'engage', 'explore', 'cultivate', 'resources', 'resource', 'acceptance', 'spirituality', 'mediation', 'practices','community', 'habits', 'success', 'areas', 'network', 'subreddits', 'create', 'recovery', 'challenges', 'others', 'options', 'evidence', 'program', 'methods', 'advice', 'hobbies', 'strength', 'interests', 'journey', 'exercises', 'seek', 'aspects', 'boundaries', 'books', 'strategies', 'concepts', 'meditation', 'studies', 'develop', 'programs', 'discipline', 'value', 'link', 'growth', 'ideas', 'beliefs', 'strategy', 'tips', 'foundation', 'concept', 'behavioral', 'solutions', 'wisdom', 'method', 'philosophy', 'apps', 'outlets', 'communities', 'topics', 'introspection', 'structure', 'links', 'routines', 'info', 'data', 'qualities', 'utilize', 'dbt', 'meditations', 'values', 'material', 'recommendations', 'cbt', 'stoicism', 'discussion', 'people', 'meetings', 'points', 'things', 'medications', 'support', 'group', 'approach', 'experiences', 'stories', 'form', 'posts', 'websites', 'site', 'perspective', 'folks', 'projects', 'goals', 'addictions', 'path', 'results', 'ways', 'vices', 'suggestions', 'diet', 'activities', 'ones', 'threads', 'groups', 'practice', 'articles', 'subs', 'research', 'skills', 'circumstances', 'insights', 'examples', 'website', 'information', 'knowledge', 'efforts', 'mindfulness', 'guidance', 'skill', 'lessons', 'guide', 'parts', 'opinions', 'rules', 'psychology', 'mechanisms', 'technique', 'supplements', 'alternatives', 'literature', 'tool', 'sources', 'principles', 'insight', 'techniques', 'factors', 'behaviors', 'buddhism', 'channel', 'videos', 'importance', 'tools', 'distractions', 'perspectives', 'conditions', 'forms', 'resources', 'resource', 'guidelines', 'therapists', 'traits', 'practices', 'affirmations', 'community', 'habits', 'areas', 'network', 'subreddits', 'subreddit', 'friendships', 'recovery', 'context', 'challenges', 'others', 'options', 'evidence', 'program', 'reasons', 'quotes', 'methods', 'stuff', 'words', 'benefits', 'advice', 'hobbies', 'steps', 'foods', 'interests', 'journey', 'exercises', 'book', 'aspects', 'boundaries', 'professionals', 'struggles', 'successes', 'books', 'places', 'strategies', 'answers', 'types', 'concepts', 'individuals', 'meditation', 'forums', 'studies', 'programs', 'link', 'ideas', 'questions', 'beliefs', 'strategy', 'tips', 'foundation', 'concept', 'substances', 'solutions', 'wisdom', 'method', 'philosophy', 'apps', 'outlets', 'forum', 'communities', 'topics', 'introspection', 'structure', 'outcomes', 'links', 'routines', 'info', 'remedies', 'data', 'qualities', 'accounts', 'treatments', 'stats', 'meditations', 'values', 'journeys', 'items', 'material', 'possibilities', 'recommendations', 'courses', 'services', 'cbt', 'elements', 'teachings', 'stoicism']
-progresswords = []
-
-for i in progwordbank:
-  if not i in progresswords:
-    progresswords.append(i);
-print (progresswords)
-
-fuckwordbank = ['frick', 'frickin', 'freakin', 'freaking,"tweak", "tweaking","fuck', 'fuckin', 'fucking', 'fucky', 'fucked, ’fuckedness', 'motherfucking', 'motherfucker', 'damn', 'goddamn', 'shit', 'shitty', 'shittier', 'shittiest', 'blasted', 'bloody','gonna', 'haha', 'coke', 'had', 'yup', 'half', 'yeah', 'bad', 'depressed', 'hell', 'kinda', 'miserable', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'ridiculous', 'fuck', 'drunk', 'awful', 'sucks', 'omg', 'ass', 'pathetic', 'nasty', 'tho', 'ha', 'oh', 'terrible', 'yesterday', 'sad', 'resin', 'dead', 'retarded', 'sack', 'everytime', 'stupid', 'lol', 'wicked', 'crazy', 'gross', 'crappy', 'fiend', 'sick', 'crack', 'grumpy', 'bc', 'cuz', 'nope', 'dope', 'yea', 'weird', 'horrible', 'lame', 'disgusting', 'dumb', 'balls', 'dank', 'hella', 'eh', 'didnt', 'crap', 'freaking', 'legit', 'yep', 'nah', 'dirty', 'fucker', 'pissed', 'junkie', 'garbage', 'hangovers', 'hahaha', 'dang', 'dying', 'bastard', 'burnt', 'cus', 'worthless', 'hahah', 'lmao', 'crackhead', 'af', 'bruh', 'carts','didn', 'last', 'shitty', 'anyways', 'mad', 'pussy', 'shit', 'fucking', 'alright', 'meh', 'hated', 'damn', 'lazy', 'straight', 'ok', 'moody', 'paranoid', 'tired', 'anxious', 'lethargic', 'goddamn', 'meth', 'irritable', 'sorta', 'dry', 'hungry', 'cos', 'nuts', 'embarrassing', 'cranky', 'annoying', 'broke', 'fuckin', 'scared', 'nauseated', 'bum', 'loser', 'tbh', 'guilty', 'till', 'boy', 'groggy', 'idiot', 'brutal', 'nauseous', 'hungover', 'foggy', 'bummed', 'wet', 'dizzy', 'terrified', 'rn', 'lmfao', 'bloody', 'fine', 'yup', 'okay', 'high', 'yeah', 'bad', 'stoned', 'afterwards', 'upset', 'depressed', 'blazed', 'kinda', 'weak', 'embarrassed', 'miserable', 'bored', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'forgetful', 'stressed', 'awkward', 'ridiculous', 'drunk', 'awful', 'sucks', 'omg', 'boring', 'pathetic', 'terrible', 'yesterday', 'sad', 'empty', 'dead', 'retarded', 'stupid', 'angry', 'lol', 'nervous', 'crazy', 'gross', 'restless', 'crappy', 'fiend', 'sick', 'ashamed', 'grumpy', 'cuz', 'yea', 'weird', 'horrible', 'lame', 'baked', 'disgusting', 'dumb', 'depressing', 'exhausted', 'frustrated', 'irritated', 'disappointed', 'confused', 'bitter', 'cloudy', 'tempted', 'pissed', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'crying', 'edgy', 'sore', 'agitated', 'dying', 'skinny', 'unmotivated', 'burnt', 'sluggish', 'hopeless', 'worthless', 'hahah', 'drained', 'lmao', 'sweaty', 'horny', 'bloated', 'af', 'odd', 'low', 'shitty', 'mad', 'pussy', 'fucking', 'hate', 'stuck', 'worse', 'alright', 'meh', 'sleepy', 'hated', 'lazy', 'ok', 'tempting', 'unhappy', 'unproductive', 'nasty', 'worried', 'overwhelmed', 'moody', 'paranoid', 'frustrating', 'tired', 'anxious', 'lethargic', 'dull', 'jealous', 'irritable', 'suicidal', 'dry', 'hungry', 'embarrassing', 'desperate', 'strange', 'cranky', 'annoying', 'fuckin', 'scared', 'nauseated', 'rough', 'bum', 'scary', 'loser', 'guilty', 'fried', 'groggy', 'antsy', 'trapped', 'apathetic', 'useless', 'nauseous', 'hungover', 'foggy', 'relieved', 'bummed', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'dizzy', 'terrified', 'thirsty', 'shaky', 'fine', 'okay', 'high', 'bad', 'stoned', 'upset', 'depressed', 'uneasy', 'normal', 'weak', 'embarrassed', 'miserable', 'bored', 'fucked', 'sucked', 'insane', 'forgetful', 'stressed', 'awkward', 'ridiculous', 'overwhelming', 'stressful', 'drunk', 'awful', 'sucks', 'boring', 'pathetic', 'terrible', 'sad', 'empty', 'retarded', 'stupid', 'angry', 'nervous', 'crazy', 'gross', 'restless', 'crappy', 'sick', 'numb', 'ashamed', 'grumpy', 'weird', 'horrible', 'lame', 'baked', 'disgusting', 'dumb', 'depressing', 'exhausted', 'frustrated', 'irritated', 'intense', 'disappointed', 'confused', 'bitter', 'insecure', 'cloudy', 'tempted', 'pissed', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'edgy', 'drowsy', 'agitated', 'isolated', 'dying', 'unmotivated', 'burnt', 'sluggish', 'hopeless', 'worthless', 'drained', 'sweaty', 'horny', 'bloated', 'jittery', 'odd', 'low', 'shitty', 'afterwards', 'mad', 'blazed', 'hate', 'stuck', 'worse', 'alright', 'meh', 'sleepy', 'hated', 'lazy', 'ok', 'tempting', 'unhappy', 'unproductive', 'overwhelmed', 'moody', 'paranoid', 'unpleasant', 'frustrating', 'tired', 'anxious', 'lethargic', 'dull', 'irritable', 'suicidal', 'hungry', 'relaxed', 'embarrassing', 'desperate', 'impatient', 'exhausting', 'strange', 'cranky', 'annoying', 'scared', 'nauseated', 'rough', 'scary', 'guilty', 'fried', 'groggy', 'antsy', 'trapped', 'apathetic', 'useless', 'nauseous', 'hungover', 'foggy', 'defeated', 'sore', 'relieved', 'bummed', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'dizzy', 'terrified', 'disconnected', 'thirsty', 'shaky', 'gonna', 'haha', 'coke', 'had', 'yup', 'half', 'yeah', 'bad', 'depressed', 'hell', 'kinda', 'miserable', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'ridiculous', 'fuck', 'drunk', 'awful', 'sucks', 'omg', 'ass', 'pathetic', 'nasty', 'tho', 'ha', 'oh', 'terrible', 'yesterday', 'sad', 'resin', 'dead', 'retarded', 'sack', 'everytime', 'stupid', 'lol', 'wicked', 'crazy', 'gross', 'crappy', 'fiend', 'sick', 'crack', 'grumpy', 'bc', 'cuz', 'nope', 'dope', 'yea', 'weird', 'horrible', 'lame', 'disgusting', 'dumb', 'balls', 'dank', 'hella', 'eh', 'didnt', 'crap', 'freaking', 'legit', 'yep', 'nah', 'dirty', 'fucker', 'pissed', 'junkie', 'garbage', 'hangovers', 'hahaha', 'dang', 'dying', 'bastard', 'burnt', 'cus', 'worthless', 'hahah', 'lmao', 'crackhead', 'af', 'bruh', 'carts', 'didn', 'last', 'shitty', 'anyways', 'mad', 'pussy', 'shit', 'fucking', 'alright', 'meh', 'hated', 'damn', 'lazy', 'straight', 'ok', 'moody', 'paranoid', 'tired', 'anxious', 'lethargic', 'goddamn', 'meth', 'irritable', 'sorta', 'dry', 'hungry', 'cos', 'nuts', 'embarrassing', 'cranky', 'annoying', 'broke', 'fuckin', 'scared', 'nauseated', 'bum', 'loser', 'tbh', 'guilty', 'till', 'boy', 'groggy', 'idiot', 'brutal', 'nauseous', 'hungover', 'foggy', 'bummed', 'wet', 'dizzy', 'terrified', 'rn', 'lmfao', 'bloody', 'fine', 'yup', 'okay', 'high', 'yeah', 'bad', 'stoned', 'afterwards', 'upset', 'depressed', 'blazed', 'kinda', 'weak', 'embarrassed', 'miserable', 'bored', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'forgetful', 'stressed', 'awkward', 'ridiculous', 'drunk', 'awful', 'sucks', 'omg', 'boring', 'pathetic', 'terrible', 'yesterday', 'sad', 'empty', 'dead', 'retarded', 'stupid', 'angry', 'lol', 'nervous', 'crazy', 'gross', 'restless', 'crappy', 'fiend', 'sick', 'ashamed', 'grumpy', 'cuz', 'yea', 'weird', 'horrible', 'lame', 'baked', 'disgusting', 'dumb', 'depressing', 'exhausted', 'frustrated', 'irritated', 'disappointed', 'confused', 'bitter', 'cloudy', 'tempted', 'pissed', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'crying', 'edgy', 'sore', 'agitated', 'dying', 'skinny', 'unmotivated', 'burnt', 'sluggish', 'hopeless', 'worthless', 'hahah', 'drained', 'lmao', 'sweaty', 'horny', 'bloated', 'af', 'odd', 'low', 'shitty', 'mad', 'pussy', 'fucking', 'hate', 'stuck', 'worse', 'alright', 'meh', 'sleepy', 'hated', 'lazy', 'ok', 'tempting', 'unhappy', 'unproductive', 'nasty', 'worried', 'overwhelmed', 'moody', 'paranoid', 'frustrating', 'tired', 'anxious', 'lethargic', 'dull', 'jealous', 'irritable', 'suicidal', 'dry', 'hungry', 'embarrassing', 'desperate', 'strange', 'cranky', 'annoying', 'fuckin', 'scared', 'nauseated', 'rough', 'bum', 'scary', 'loser', 'guilty', 'fried', 'groggy', 'antsy', 'trapped', 'apathetic', 'useless', 'nauseous', 'hungover', 'foggy', 'relieved', 'bummed', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'dizzy', 'terrified', 'thirsty', 'shaky', 'fine', 'okay', 'high', 'bad', 'stoned', 'upset', 'depressed', 'uneasy', 'normal', 'weak', 'embarrassed', 'miserable', 'bored', 'fucked', 'sucked', 'insane', 'forgetful', 'stressed', 'awkward', 'ridiculous', 'overwhelming', 'stressful', 'drunk', 'awful', 'sucks', 'boring', 'pathetic', 'terrible', 'sad', 'empty', 'retarded', 'stupid', 'angry', 'nervous', 'crazy', 'gross', 'restless', 'crappy', 'sick', 'numb', 'ashamed', 'grumpy', 'weird', 'horrible', 'lame', 'baked', 'disgusting', 'dumb', 'depressing', 'exhausted', 'frustrated', 'irritated', 'intense', 'disappointed', 'confused', 'bitter', 'insecure', 'cloudy', 'tempted', 'pissed', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'edgy', 'drowsy', 'agitated', 'isolated', 'dying', 'unmotivated', 'burnt', 'sluggish', 'hopeless', 'worthless', 'drained', 'sweaty', 'horny', 'bloated', 'jittery', 'odd', 'low', 'shitty', 'afterwards', 'mad', 'blazed', 'hate', 'stuck', 'worse', 'alright', 'meh', 'sleepy', 'hated', 'lazy', 'ok', 'tempting', 'unhappy', 'unproductive', 'overwhelmed', 'moody', 'paranoid', 'unpleasant', 'frustrating', 'tired', 'anxious', 'lethargic', 'dull', 'irritable', 'suicidal', 'hungry', 'relaxed', 'embarrassing', 'desperate', 'impatient', 'exhausting', 'strange', 'cranky', 'annoying', 'scared', 'nauseated', 'rough', 'scary', 'guilty', 'fried', 'groggy', 'antsy', 'trapped', 'apathetic', 'useless', 'nauseous', 'hungover', 'foggy', 'defeated', 'sore', 'relieved', 'bummed', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'dizzy', 'terrified', 'disconnected', 'thirsty', 'shaky']
-fuckwords = []
-for i in fuckwordbank:
-  if not i in fuckwords:
-    fuckwords.append(i);
-print (fuckwords)
+    returns
+    None, or the error if the model could not be loaded
+    '''
+    from gensim.models import KeyedVectors
+    try:
+        model = KeyedVectors.load(modelpath, mmap='r')
+        load_word_attributes(model, modelpath)
+    except Exception as e:
+        return repr(e)
+    return None
+
+def run_batch(manifestpath, outputpath, processes=None):
+    '''
+    Runs many meta analyses (e.g. many seed set pairs over a family of models) on a process pool.
+
+    manifestpath str : JSON Lines file, one job per line like
+                       {"model": "leaves_w4_f10_e100_d150.model", "targetset1": [...], "targetset2": [...], "stdevs": 4, "depth": 6}
+                       (depth defaults to 1, "converge": true stops a job once its sets stop changing,
+                       "instrument": true records its Instrumentation and "cluster": true also clusters every set of
+                       biased words with cluster_words)
+    outputpath str : JSON Lines file where the result of every job is written as soon as it finishes (see
+                     BiasedWordsWriter), one line per biased word like
+                     {"job": <line number in the manifest>, "model": ..., "cycle": 1, "set": 1, "word": ..., "bias": ..., ...}
+                     or {"job": ..., "model": ..., "error": ...} if the job failed (or its model could not be loaded, or
+                     it has no model). Instrumented jobs also write
+                     {"job": ..., "model": ..., "metrics": {"timers": {...}, "counters": {...}}}, and clustered jobs
+                     {"job": ..., "model": ..., "cycle": 1, "set": 1, "word": ..., "cluster": 0, "dist": ...} for every
+                     word plus {"job": ..., "model": ..., "cycle": 1, "set": 1, "centroids": [[...], ...]}
+    processes int : number of worker processes, defaults to the number of CPUs
+    '''
+    with open(manifestpath) as f:
+        jobs = [json.loads(line) for line in f if line.strip()]
+    invalid = [i for i, job in enumerate(jobs) if 'model' not in job]
+    # Jobs are dispatched in model order and workers only keep the model of their current job loaded (see
+    # _load_model), so each worker loads every model at most once and never holds more than one
+    jobs = sorted([[i, job] for i, job in enumerate(jobs) if 'model' in job], key=lambda job: job[1]['model'])
+    modelpaths = sorted(set(job['model'] for [i, job] in jobs))
+
+    with multiprocessing.Pool(processes) as pool, BiasedWordsWriter(outputpath) as writer:
+        for i in invalid:
+            writer.write_line(job=i, model=None, error=repr(KeyError('model')))
+        # Build the sidecars of every model first, one model per worker in parallel, instead of racing to build them
+        # in every job. A model that cannot be loaded only fails its own jobs.
+        failed = {modelpath: error for modelpath, error in zip(modelpaths, pool.map(_build_batch_sidecars, modelpaths, chunksize=1))
+                  if error is not None}
+        for [i, job] in jobs:
+            if job['model'] in failed:
+                writer.write_line(job=i, model=job['model'], error=failed[job['model']])
+        jobs = [job for job in jobs if job[1]['model'] not in failed]
+        for result in pool.imap_unordered(_run_batch_job, jobs):
+            if 'error' in result:
+                writer.write_line(job=result['job'], model=result['model'], error=result['error'])
+                continue
+            for cycle, sets in enumerate(result['cycles'], 1):
+                for tset, [words, records] in enumerate(sets, 1):
+                    writer.write_records(words, records, job=result['job'], model=result['model'], cycle=cycle, set=tset)
+            for cycle, sets in enumerate(result.get('clusters', []), 1):
+                for tset, [words, records, centroids] in enumerate(sets, 1):
+                    fields = {'job': result['job'], 'model': result['model'], 'cycle': cycle, 'set': tset}
+                    writer.write_records(words, records, **fields)
+                    writer.write_line(centroids=centroids.tolist(), **fields)
+            if 'metrics' in result:
+                writer.write_line(job=result['job'], model=result['model'], metrics=result['metrics'])
+
+if __name__ == '__main__' and len(sys.argv) > 1 and sys.argv[1] == 'batch':
+    # Batch mode: python r_leaves_word_embeddings_meta_analysis_notebook.py batch <manifest.jsonl> <results.jsonl> [--processes N]
+    # (an explicit subcommand, so notebook kernels started with their own arguments still run the analysis below)
+    import argparse
+    parser = argparse.ArgumentParser(prog='{} batch'.format(os.path.basename(sys.argv[0])),
+                                     description='Runs the meta analyses of a JSON Lines manifest on a process pool')
+    parser.add_argument('manifest', help='JSON Lines file with one job per line (see run_batch)')
+    parser.add_argument('output', help='JSON Lines file for the results')
+    parser.add_argument('--processes', type=int, default=None, help='worker processes, defaults to the number of CPUs')
+    args = parser.parse_args(sys.argv[2:])
+    run_batch(args.manifest, args.output, args.processes)
+elif __name__ == '__main__':
+    from gensim.models import Word2Vec
+    modelpath = "leaves_w4_f10_e100_d150.model"
+    model = Word2Vec.load(modelpath)
+    instr = Instrumentation(progress=lambda stage, done, total: print('....{}: {}/{} words'.format(stage, done, total)),
+                            progressEvery=50000)
+    load_word_attributes(model, modelpath, instr)
+
+    import time
+    starttime = time.time()
+
+
+    progress = ['discussion', 'find', 'understanding', 'useful', 'support', 'group', 'approach', 'subreddit', 'perspective', 'benefit', 'therapy', 'positive', 'improve', 'helpful', 'reflect', 'motivate', 'practice', 'sub', 'focused', 'provide', 'information', 'knowledge', 'encourage', 'meditate', 'focusing', 'mindfulness', 'guidance', 'outlook', 'skill', 'guide', 'headspace', 'technique', 'forum', 'compassion', 'practicing', 'tool', 'insight', 'techniques', 'achieve', 'accountability', 'awareness', 'meditating', 'buddhism', 'channel', 'importance', 'identify', 'beneficial', 'engage', 'explore', 'constructive', 'mindful', 'cultivate', 'resources', 'resource', 'acceptance', 'journaling', 'grounded', 'positivity', 'spirituality', 'mediation', 'gratitude', 'refocus', 'community', 'help', 'exercise', 'success', 'create', 'recovery', 'others', 'address', 'methods', 'learn', 'interests', 'journey', 'seek', 'practical', 'strategies', 'reflection', 'meditation', 'develop', 'discipline', 'value', 'growth', 'ideas', 'focus', 'strategy', 'tips', 'behavioral', 'solutions', 'wisdom', 'philosophy', 'introspection', 'structure', 'kindness', 'implement', 'info', 'discuss', 'utilize', 'strengthen', 'dbt', 'meditations', 'reinforce', 'cbt', 'stoicism', 'build', 'experiences', 'form', 'overcome', 'ways', 'suggestions', 'activities', 'groups', 'research', 'insights', 'website', 'lessons', 'psychology', 'mechanisms', 'alternatives', 'literature', 'sources', 'principles', 'behaviors', 'tools', 'perspectives', 'practices', 'habits', 'areas', 'network', 'subreddits', 'challenges', 'options', 'evidence', 'program', 'advice', 'hobbies', 'strength', 'exercises', 'aspects', 'boundaries', 'books', 'concepts', 'studies', 'programs', 'link', 'beliefs', 'foundation', 'concept', 'method', 'apps', 'outlets', 'communities', 'topics', 'links', 'routines', 'data', 'qualities', 'values', 'material', 'recommendations', 'people', 'meetings', 'points', 'things', 'medications', 'stories', 'posts', 'websites', 'site', 'folks', 'projects', 'goals', 'addictions', 'path', 'results', 'vices', 'diet', 'ones', 'threads', 'articles', 'subs', 'skills', 'circumstances', 'examples', 'efforts', 'parts', 'opinions', 'rules', 'supplements', 'factors', 'videos', 'distractions', 'conditions', 'forms', 'guidelines', 'therapists', 'traits', 'affirmations', 'friendships', 'context', 'reasons', 'quotes', 'stuff', 'words', 'benefits', 'steps', 'foods', 'book', 'professionals', 'struggles', 'successes', 'places', 'answers', 'types', 'individuals', 'forums', 'questions', 'substances', 'outcomes', 'remedies', 'accounts', 'treatments', 'stats', 'journeys', 'items', 'possibilities', 'courses', 'services', 'elements', 'teachings']
+    exasperation = ['gonna', 'haha', 'coke', 'had', 'yup', 'half', 'yeah', 'bad', 'depressed', 'hell', 'kinda', 'miserable', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'ridiculous', 'fuck', 'drunk', 'awful', 'sucks', 'omg', 'ass', 'pathetic', 'nasty', 'tho', 'ha', 'oh', 'terrible', 'yesterday', 'sad', 'resin', 'dead', 'retarded', 'sack', 'everytime', 'stupid', 'lol', 'wicked', 'crazy', 'gross', 'crappy', 'fiend', 'sick', 'crack', 'grumpy', 'bc', 'cuz', 'nope', 'dope', 'yea', 'weird', 'horrible', 'lame', 'disgusting', 'dumb', 'balls', 'dank', 'hella', 'eh', 'didnt', 'crap', 'freaking', 'legit', 'yep', 'nah', 'dirty', 'fucker', 'pissed', 'junkie', 'garbage', 'hangovers', 'hahaha', 'dang', 'dying', 'bastard', 'burnt', 'cus', 'worthless', 'hahah', 'lmao', 'crackhead', 'af', 'bruh', 'carts', 'didn', 'last', 'anyways', 'mad', 'pussy', 'alright', 'meh', 'hated', 'lazy', 'straight', 'ok', 'moody', 'paranoid', 'tired', 'anxious', 'lethargic', 'meth', 'irritable', 'sorta', 'dry', 'hungry', 'cos', 'nuts', 'embarrassing', 'cranky', 'annoying', 'broke', 'scared', 'nauseated', 'bum', 'loser', 'tbh', 'guilty', 'till', 'boy', 'groggy', 'idiot', 'brutal', 'nauseous', 'hungover', 'foggy', 'bummed', 'wet', 'dizzy', 'terrified', 'rn', 'lmfao', 'fine', 'okay', 'high', 'stoned', 'afterwards', 'upset', 'blazed', 'weak', 'embarrassed', 'bored', 'forgetful', 'stressed', 'awkward', 'boring', 'empty', 'angry', 'nervous', 'restless', 'ashamed', 'baked', 'depressing', 'exhausted', 'frustrated', 'irritated', 'disappointed', 'confused', 'bitter', 'cloudy', 'tempted', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'crying', 'edgy', 'sore', 'agitated', 'skinny', 'unmotivated', 'sluggish', 'hopeless', 'drained', 'sweaty', 'horny', 'bloated', 'odd', 'low', 'hate', 'stuck', 'worse', 'sleepy', 'tempting', 'unhappy', 'unproductive', 'worried', 'overwhelmed', 'frustrating', 'dull', 'jealous', 'suicidal', 'desperate', 'strange', 'rough', 'scary', 'fried', 'antsy', 'trapped', 'apathetic', 'useless', 'relieved', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'thirsty', 'shaky', 'uneasy', 'normal', 'overwhelming', 'stressful', 'numb', 'intense', 'insecure', 'drowsy', 'isolated', 'jittery', 'unpleasant', 'relaxed', 'impatient', 'exhausting', 'defeated', 'disconnected']
+    cycles = []
+    for layer, [biased1, biased2] in enumerate(MetaAnalysis(model, progress, exasperation, 4, depth=6, modelpath=modelpath,
+                                                                       instrumentation=instr), 1):
+        print('..layer {} done: {} / {} biased words ({} seconds)'.format(layer, len(biased1), len(biased2), time.time()-starttime))
+        cycles.append([biased1, biased2])
+    [[cycle1, cycle1a], [cycle2, cycle2a], [cycle3, cycle3a], [cycle4, cycle4a], [cycle5, cycle5a], [cycle6, cycle6a]] = cycles
+    print('-> meta-analysis only took us {} seconds!'.format(time.time()-starttime))
+    print(json.dumps(instr.summary(), indent=2))
+
+    print('My seed words related to progress:')
+    print(progress)
+    print()
+    print('Biased words towards progress')
+    print( [w for w in cycle1.words()] )
+    print()
+    print('Layer 1 metabiased words towards progress')
+    print( [w for w in cycle2.words()])
+    print()
+    print('Layer 3 metabiased words towards progress')
+    print( [w for w in cycle3.words()])
+    print()
+    print('Layer 4 metabiased words towards progress')
+    print( [w for w in cycle4.words()])
+    print()
+    print('Layer 4 metabiased words towards progress')
+    print( [w for w in cycle5.words()])
+    print()
+    print('Layer 5 metabiased words towards progress')
+    print( [w for w in cycle6.words()])
+    print()
+    print()
+    print('My seed words related to exasperation:')
+    print(exasperation)
+    print()
+    print('Biased words towards exasperation')
+    print( [w for w in cycle1a.words()] )
+    print()
+    print('Layer 1 metabiased words towards exasperation')
+    print( [w for w in cycle2a.words()])
+    print()
+    print('Layer 2 metabiased words towards exasperation')
+    print( [w for w in cycle3a.words()])
+    print()
+    print('Layer 3 metabiased words towards exasperation')
+    print( [w for w in cycle4a.words()])
+    print()
+    print('Layer 4 metabiased words towards exasperation')
+    print( [w for w in cycle5a.words()])
+    print()
+    print('Layer 5 metabiased words towards exasperation')
+    print( [w for w in cycle6a.words()])
+    print()
+
+    # Themes of the biased words of every layer
+    for layer, [biased1, biased2] in enumerate(cycles, 1):
+        instr.labels['cycle'] = layer
+        for name, biased in [('progress', biased1), ('exasperation', biased2)]:
+            clusters = cluster_words(biased, instrumentation=instr)
+            print('Layer {} themes towards {} ({} clusters)'.format(layer, name, len(clusters.centroids)))
+            for theme in clusters.clusters():
+                print('  ', theme[:15])
+    instr.labels.pop('cycle', None)
+    print()
+
+    progwordbank = ['discussion', 'find', 'understanding', 'useful', 'support', 'group', 'approach', 'subreddit', 'perspective', 'benefit', 'therapy', 'positive', 'improve', 'helpful', 'reflect', 'motivate', 'practice', 'sub', 'focused', 'provide', 'information', 'knowledge', 'encourage', 'meditate', 'focusing', 'mindfulness', 'guidance', 'outlook', 'skill', 'guide', 'headspace', 'technique', 'forum', 'compassion', 'practicing', 'tool', 'insight', 'techniques', 'achieve', 'accountability', 'awareness', 'meditating', 'buddhism', 'channel', 'importance', 'identify', 'beneficial', 'engage', 'explore', 'constructive', 'mindful', 'cultivate', 'resources', 'resource', 'acceptance', 'journaling', 'grounded', 'positivity', 'spirituality', 'mediation', 'gratitude', 'refocus','community', 'help', 'exercise', 'success', 'create', 'recovery', 'others', 'address', 'methods', 'learn', 'interests', 'journey', 'seek', 'practical', 'strategies', 'reflection', 'meditation', 'develop', 'discipline', 'value', 'growth', 'ideas', 'focus', 'strategy', 'tips', 'behavioral', 'solutions', 'wisdom', 'philosophy', 'introspection', 'structure', 'kindness', 'implement', 'info', 'discuss', 'utilize', 'strengthen', 'dbt', 'meditations', 'reinforce', 'cbt', 'stoicism', 'discussion', 'find', 'understanding', 'support', 'build', 'group', 'approach', 'experiences', 'form', 'perspective', 'overcome', 'therapy', 'ways', 'suggestions', 'activities', 'groups', 'practice', 'provide', 'research', 'insights', 'website', 'information', 'knowledge', 'mindfulness', 'guidance', 'skill', 'lessons', 'guide', 'psychology', 'mechanisms', 'technique', 'compassion', 'alternatives', 'literature', 'tool', 'sources', 'principles', 'insight', 'techniques', 'behaviors', 'awareness', 'buddhism', 'channel', 'importance', 'tools', 'perspectives', 'engage', 'explore', 'cultivate', 'resources', 'resource', 'acceptance', 'spirituality', 'mediation', 'practices','community', 'habits', 'success', 'areas', 'network', 'subreddits', 'create', 'recovery', 'challenges', 'others', 'options', 'evidence', 'program', 'methods', 'advice', 'hobbies', 'strength', 'interests', 'journey', 'exercises', 'seek', 'aspects', 'boundaries', 'books', 'strategies', 'concepts', 'meditation', 'studies', 'develop', 'programs', 'discipline', 'value', 'link', 'growth', 'ideas', 'beliefs', 'strategy', 'tips', 'foundation', 'concept', 'behavioral', 'solutions', 'wisdom', 'method', 'philosophy', 'apps', 'outlets', 'communities', 'topics', 'introspection', 'structure', 'links', 'routines', 'info', 'data', 'qualities', 'utilize', 'dbt', 'meditations', 'values', 'material', 'recommendations', 'cbt', 'stoicism', 'discussion', 'people', 'meetings', 'points', 'things', 'medications', 'support', 'group', 'approach', 'experiences', 'stories', 'form', 'posts', 'websites', 'site', 'perspective', 'folks', 'projects', 'goals', 'addictions', 'path', 'results', 'ways', 'vices', 'suggestions', 'diet', 'activities', 'ones', 'threads', 'groups', 'practice', 'articles', 'subs', 'research', 'skills', 'circumstances', 'insights', 'examples', 'website', 'information', 'knowledge', 'efforts', 'mindfulness', 'guidance', 'skill', 'lessons', 'guide', 'parts', 'opinions', 'rules', 'psychology', 'mechanisms', 'technique', 'supplements', 'alternatives', 'literature', 'tool', 'sources', 'principles', 'insight', 'techniques', 'factors', 'behaviors', 'buddhism', 'channel', 'videos', 'importance', 'tools', 'distractions', 'perspectives', 'conditions', 'forms', 'resources', 'resource', 'guidelines', 'therapists', 'traits', 'practices', 'affirmations', 'community', 'habits', 'areas', 'network', 'subreddits', 'subreddit', 'friendships', 'recovery', 'context', 'challenges', 'others', 'options', 'evidence', 'program', 'reasons', 'quotes', 'methods', 'stuff', 'words', 'benefits', 'advice', 'hobbies', 'steps', 'foods', 'interests', 'journey', 'exercises', 'book', 'aspects', 'boundaries', 'professionals', 'struggles', 'successes', 'books', 'places', 'strategies', 'answers', 'types', 'concepts', 'individuals', 'meditation', 'forums', 'studies', 'programs', 'link', 'ideas', 'questions', 'beliefs', 'strategy', 'tips', 'foundation', 'concept', 'substances', 'solutions', 'wisdom', 'method', 'philosophy', 'apps', 'outlets', 'forum', 'communities', 'topics', 'introspection', 'structure', 'outcomes', 'links', 'routines', 'info', 'remedies', 'data', 'qualities', 'accounts', 'treatments', 'stats', 'meditations', 'values', 'journeys', 'items', 'material', 'possibilities', 'recommendations', 'courses', 'services', 'cbt', 'elements', 'teachings', 'stoicism']
+    progresswords = _unique(progwordbank)
+    print (progresswords)
+
+    fuckwordbank = ['frick', 'frickin', 'freakin', 'freaking,"tweak", "tweaking","fuck', 'fuckin', 'fucking', 'fucky', 'fucked, ’fuckedness', 'motherfucking', 'motherfucker', 'damn', 'goddamn', 'shit', 'shitty', 'shittier', 'shittiest', 'blasted', 'bloody','gonna', 'haha', 'coke', 'had', 'yup', 'half', 'yeah', 'bad', 'depressed', 'hell', 'kinda', 'miserable', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'ridiculous', 'fuck', 'drunk', 'awful', 'sucks', 'omg', 'ass', 'pathetic', 'nasty', 'tho', 'ha', 'oh', 'terrible', 'yesterday', 'sad', 'resin', 'dead', 'retarded', 'sack', 'everytime', 'stupid', 'lol', 'wicked', 'crazy', 'gross', 'crappy', 'fiend', 'sick', 'crack', 'grumpy', 'bc', 'cuz', 'nope', 'dope', 'yea', 'weird', 'horrible', 'lame', 'disgusting', 'dumb', 'balls', 'dank', 'hella', 'eh', 'didnt', 'crap', 'freaking', 'legit', 'yep', 'nah', 'dirty', 'fucker', 'pissed', 'junkie', 'garbage', 'hangovers', 'hahaha', 'dang', 'dying', 'bastard', 'burnt', 'cus', 'worthless', 'hahah', 'lmao', 'crackhead', 'af', 'bruh', 'carts','didn', 'last', 'shitty', 'anyways', 'mad', 'pussy', 'shit', 'fucking', 'alright', 'meh', 'hated', 'damn', 'lazy', 'straight', 'ok', 'moody', 'paranoid', 'tired', 'anxious', 'lethargic', 'goddamn', 'meth', 'irritable', 'sorta', 'dry', 'hungry', 'cos', 'nuts', 'embarrassing', 'cranky', 'annoying', 'broke', 'fuckin', 'scared', 'nauseated', 'bum', 'loser', 'tbh', 'guilty', 'till', 'boy', 'groggy', 'idiot', 'brutal', 'nauseous', 'hungover', 'foggy', 'bummed', 'wet', 'dizzy', 'terrified', 'rn', 'lmfao', 'bloody', 'fine', 'yup', 'okay', 'high', 'yeah', 'bad', 'stoned', 'afterwards', 'upset', 'depressed', 'blazed', 'kinda', 'weak', 'embarrassed', 'miserable', 'bored', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'forgetful', 'stressed', 'awkward', 'ridiculous', 'drunk', 'awful', 'sucks', 'omg', 'boring', 'pathetic', 'terrible', 'yesterday', 'sad', 'empty', 'dead', 'retarded', 'stupid', 'angry', 'lol', 'nervous', 'crazy', 'gross', 'restless', 'crappy', 'fiend', 'sick', 'ashamed', 'grumpy', 'cuz', 'yea', 'weird', 'horrible', 'lame', 'baked', 'disgusting', 'dumb', 'depressing', 'exhausted', 'frustrated', 'irritated', 'disappointed', 'confused', 'bitter', 'cloudy', 'tempted', 'pissed', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'crying', 'edgy', 'sore', 'agitated', 'dying', 'skinny', 'unmotivated', 'burnt', 'sluggish', 'hopeless', 'worthless', 'hahah', 'drained', 'lmao', 'sweaty', 'horny', 'bloated', 'af', 'odd', 'low', 'shitty', 'mad', 'pussy', 'fucking', 'hate', 'stuck', 'worse', 'alright', 'meh', 'sleepy', 'hated', 'lazy', 'ok', 'tempting', 'unhappy', 'unproductive', 'nasty', 'worried', 'overwhelmed', 'moody', 'paranoid', 'frustrating', 'tired', 'anxious', 'lethargic', 'dull', 'jealous', 'irritable', 'suicidal', 'dry', 'hungry', 'embarrassing', 'desperate', 'strange', 'cranky', 'annoying', 'fuckin', 'scared', 'nauseated', 'rough', 'bum', 'scary', 'loser', 'guilty', 'fried', 'groggy', 'antsy', 'trapped', 'apathetic', 'useless', 'nauseous', 'hungover', 'foggy', 'relieved', 'bummed', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'dizzy', 'terrified', 'thirsty', 'shaky', 'fine', 'okay', 'high', 'bad', 'stoned', 'upset', 'depressed', 'uneasy', 'normal', 'weak', 'embarrassed', 'miserable', 'bored', 'fucked', 'sucked', 'insane', 'forgetful', 'stressed', 'awkward', 'ridiculous', 'overwhelming', 'stressful', 'drunk', 'awful', 'sucks', 'boring', 'pathetic', 'terrible', 'sad', 'empty', 'retarded', 'stupid', 'angry', 'nervous', 'crazy', 'gross', 'restless', 'crappy', 'sick', 'numb', 'ashamed', 'grumpy', 'weird', 'horrible', 'lame', 'baked', 'disgusting', 'dumb', 'depressing', 'exhausted', 'frustrated', 'irritated', 'intense', 'disappointed', 'confused', 'bitter', 'insecure', 'cloudy', 'tempted', 'pissed', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'edgy', 'drowsy', 'agitated', 'isolated', 'dying', 'unmotivated', 'burnt', 'sluggish', 'hopeless', 'worthless', 'drained', 'sweaty', 'horny', 'bloated', 'jittery', 'odd', 'low', 'shitty', 'afterwards', 'mad', 'blazed', 'hate', 'stuck', 'worse', 'alright', 'meh', 'sleepy', 'hated', 'lazy', 'ok', 'tempting', 'unhappy', 'unproductive', 'overwhelmed', 'moody', 'paranoid', 'unpleasant', 'frustrating', 'tired', 'anxious', 'lethargic', 'dull', 'irritable', 'suicidal', 'hungry', 'relaxed', 'embarrassing', 'desperate', 'impatient', 'exhausting', 'strange', 'cranky', 'annoying', 'scared', 'nauseated', 'rough', 'scary', 'guilty', 'fried', 'groggy', 'antsy', 'trapped', 'apathetic', 'useless', 'nauseous', 'hungover', 'foggy', 'defeated', 'sore', 'relieved', 'bummed', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'dizzy', 'terrified', 'disconnected', 'thirsty', 'shaky', 'gonna', 'haha', 'coke', 'had', 'yup', 'half', 'yeah', 'bad', 'depressed', 'hell', 'kinda', 'miserable', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'ridiculous', 'fuck', 'drunk', 'awful', 'sucks', 'omg', 'ass', 'pathetic', 'nasty', 'tho', 'ha', 'oh', 'terrible', 'yesterday', 'sad', 'resin', 'dead', 'retarded', 'sack', 'everytime', 'stupid', 'lol', 'wicked', 'crazy', 'gross', 'crappy', 'fiend', 'sick', 'crack', 'grumpy', 'bc', 'cuz', 'nope', 'dope', 'yea', 'weird', 'horrible', 'lame', 'disgusting', 'dumb', 'balls', 'dank', 'hella', 'eh', 'didnt', 'crap', 'freaking', 'legit', 'yep', 'nah', 'dirty', 'fucker', 'pissed', 'junkie', 'garbage', 'hangovers', 'hahaha', 'dang', 'dying', 'bastard', 'burnt', 'cus', 'worthless', 'hahah', 'lmao', 'crackhead', 'af', 'bruh', 'carts', 'didn', 'last', 'shitty', 'anyways', 'mad', 'pussy', 'shit', 'fucking', 'alright', 'meh', 'hated', 'damn', 'lazy', 'straight', 'ok', 'moody', 'paranoid', 'tired', 'anxious', 'lethargic', 'goddamn', 'meth', 'irritable', 'sorta', 'dry', 'hungry', 'cos', 'nuts', 'embarrassing', 'cranky', 'annoying', 'broke', 'fuckin', 'scared', 'nauseated', 'bum', 'loser', 'tbh', 'guilty', 'till', 'boy', 'groggy', 'idiot', 'brutal', 'nauseous', 'hungover', 'foggy', 'bummed', 'wet', 'dizzy', 'terrified', 'rn', 'lmfao', 'bloody', 'fine', 'yup', 'okay', 'high', 'yeah', 'bad', 'stoned', 'afterwards', 'upset', 'depressed', 'blazed', 'kinda', 'weak', 'embarrassed', 'miserable', 'bored', 'fucked', 'bitch', 'sucked', 'wtf', 'insane', 'forgetful', 'stressed', 'awkward', 'ridiculous', 'drunk', 'awful', 'sucks', 'omg', 'boring', 'pathetic', 'terrible', 'yesterday', 'sad', 'empty', 'dead', 'retarded', 'stupid', 'angry', 'lol', 'nervous', 'crazy', 'gross', 'restless', 'crappy', 'fiend', 'sick', 'ashamed', 'grumpy', 'cuz', 'yea', 'weird', 'horrible', 'lame', 'baked', 'disgusting', 'dumb', 'depressing', 'exhausted', 'frustrated', 'irritated', 'disappointed', 'confused', 'bitter', 'cloudy', 'tempted', 'pissed', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'crying', 'edgy', 'sore', 'agitated', 'dying', 'skinny', 'unmotivated', 'burnt', 'sluggish', 'hopeless', 'worthless', 'hahah', 'drained', 'lmao', 'sweaty', 'horny', 'bloated', 'af', 'odd', 'low', 'shitty', 'mad', 'pussy', 'fucking', 'hate', 'stuck', 'worse', 'alright', 'meh', 'sleepy', 'hated', 'lazy', 'ok', 'tempting', 'unhappy', 'unproductive', 'nasty', 'worried', 'overwhelmed', 'moody', 'paranoid', 'frustrating', 'tired', 'anxious', 'lethargic', 'dull', 'jealous', 'irritable', 'suicidal', 'dry', 'hungry', 'embarrassing', 'desperate', 'strange', 'cranky', 'annoying', 'fuckin', 'scared', 'nauseated', 'rough', 'bum', 'scary', 'loser', 'guilty', 'fried', 'groggy', 'antsy', 'trapped', 'apathetic', 'useless', 'nauseous', 'hungover', 'foggy', 'relieved', 'bummed', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'dizzy', 'terrified', 'thirsty', 'shaky', 'fine', 'okay', 'high', 'bad', 'stoned', 'upset', 'depressed', 'uneasy', 'normal', 'weak', 'embarrassed', 'miserable', 'bored', 'fucked', 'sucked', 'insane', 'forgetful', 'stressed', 'awkward', 'ridiculous', 'overwhelming', 'stressful', 'drunk', 'awful', 'sucks', 'boring', 'pathetic', 'terrible', 'sad', 'empty', 'retarded', 'stupid', 'angry', 'nervous', 'crazy', 'gross', 'restless', 'crappy', 'sick', 'numb', 'ashamed', 'grumpy', 'weird', 'horrible', 'lame', 'baked', 'disgusting', 'dumb', 'depressing', 'exhausted', 'frustrated', 'irritated', 'intense', 'disappointed', 'confused', 'bitter', 'insecure', 'cloudy', 'tempted', 'pissed', 'panicked', 'zombie', 'hazy', 'dehydrated', 'fatigued', 'uncomfortable', 'annoyed', 'edgy', 'drowsy', 'agitated', 'isolated', 'dying', 'unmotivated', 'burnt', 'sluggish', 'hopeless', 'worthless', 'drained', 'sweaty', 'horny', 'bloated', 'jittery', 'odd', 'low', 'shitty', 'afterwards', 'mad', 'blazed', 'hate', 'stuck', 'worse', 'alright', 'meh', 'sleepy', 'hated', 'lazy', 'ok', 'tempting', 'unhappy', 'unproductive', 'overwhelmed', 'moody', 'paranoid', 'unpleasant', 'frustrating', 'tired', 'anxious', 'lethargic', 'dull', 'irritable', 'suicidal', 'hungry', 'relaxed', 'embarrassing', 'desperate', 'impatient', 'exhausting', 'strange', 'cranky', 'annoying', 'scared', 'nauseated', 'rough', 'scary', 'guilty', 'fried', 'groggy', 'antsy', 'trapped', 'apathetic', 'useless', 'nauseous', 'hungover', 'foggy', 'defeated', 'sore', 'relieved', 'bummed', 'fuzzy', 'disgusted', 'pointless', 'unstable', 'unbearable', 'dizzy', 'terrified', 'disconnected', 'thirsty', 'shaky']
+    fuckwords = _unique(fuckwordbank)
+    print (fuckwords)
 